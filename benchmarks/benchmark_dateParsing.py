@@ -0,0 +1,55 @@
+import os
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from dateParsing import parse_date, parse_many
+
+def str_to_datetime(dateString: str) -> datetime:
+    # Str_To_Datetime as previously duplicated in both adapters
+    inputFormat = "%Y-%m-%d %H:%M:%S"
+    dateString = dateString.replace('T', ' ')
+    dateString = dateString.replace('Z', '')
+    if '+' in dateString:
+        dateString = dateString[:dateString.find('+')]
+    if '.' in dateString:
+        dateString = dateString[:dateString.find('.')]
+
+    if '-' in dateString[:6]:
+        try:
+            returnDatetime = datetime.strptime(dateString, inputFormat)
+        except:
+            inputFormat = "%Y-%m-%d"
+            returnDatetime = datetime.strptime(dateString, inputFormat)
+    else:
+        try:
+            inputFormat = "%m/%d/%Y %H:%M:%S"
+            returnDatetime = datetime.strptime(dateString, inputFormat)
+        except:
+            inputFormat = "%m/%d/%Y"
+            returnDatetime = datetime.strptime(dateString, inputFormat)
+
+    return returnDatetime
+
+def generate_dates(count: int, template: str, seed: int = 0):
+    generator = random.Random(seed)
+    start = datetime(2020, 1, 1)
+    return [(start + timedelta(seconds=generator.randrange(100000000))).strftime(template) for _ in range(count)]
+
+def run_case(name: str, dateStrings: list, repeat: int = 5):
+    results = {
+        "Str_To_Datetime": min(timeit.repeat(lambda: [str_to_datetime(dateString) for dateString in dateStrings], number=1, repeat=repeat)),
+        "parse_date": min(timeit.repeat(lambda: [parse_date(dateString, name) for dateString in dateStrings], number=1, repeat=repeat)),
+        "parse_many": min(timeit.repeat(lambda: parse_many(dateStrings, name), number=1, repeat=repeat))
+    }
+    print(name)
+    for method, seconds in results.items():
+        print(f"    {method:<16} {seconds / len(dateStrings) * 1e6:8.3f} us/record")
+
+if __name__ == "__main__":
+    recordCount = 50000
+    run_case("ADO revisions", generate_dates(recordCount, "%Y-%m-%dT%H:%M:%S.%fZ"))
+    run_case("Jira changelog", generate_dates(recordCount, "%Y-%m-%dT%H:%M:%S.000-0500"))
+    run_case("GitHub commits", generate_dates(recordCount, "%Y-%m-%dT%H:%M:%SZ"))
+    run_case("Desktop entry", generate_dates(recordCount, "%m/%d/%Y %H:%M:%S"))
@@ -0,0 +1,104 @@
+import os
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from timelineEngine import build_timeline, build_timelines
+
+# Granularity indexes into the comparison list the same way TimeGranularity does in the adapters
+DAY = 2
+HOUR = 3
+
+def number_compare(num1: int, num2: int):
+    if num1 > num2:
+        return 1
+    elif num2 > num1:
+        return -1
+    else:
+        return 0
+
+def compare_dates(day1: datetime, day2: datetime, granularity: int = DAY):
+    yearCompare = number_compare(day1.year, day2.year)
+    monthCompare = number_compare(day1.month, day2.month)
+    dayCompare = number_compare(day1.day, day2.day)
+    hourCompare = number_compare(day1.hour, day2.hour)
+    minuteCompare = number_compare(day1.minute, day2.minute)
+    secondCompare = number_compare(day1.second, day2.second)
+    compareList = [yearCompare, monthCompare, dayCompare, hourCompare, minuteCompare, secondCompare]
+
+    for i in range(0, granularity + 1):
+        if compareList[i] != 0:
+            return compareList[i]
+    return 0
+
+def loop_timeline(fieldChanges: list, fromDate: datetime, toDate: datetime, step: timedelta = timedelta(days=1), granularity: int = DAY):
+    # The day loop previously in WorkitemAdapter.Get_Workitem_Field_History, with the step and granularity made explicit
+    returnArray = []
+    numberOfSteps = (toDate - fromDate) // step + 1
+    if (toDate - fromDate) % step >= timedelta(seconds=1):
+        numberOfSteps += 1
+
+    previousVal = None
+    fieldChangIndex = 0
+    for index, fieldChange in enumerate(fieldChanges):
+        if compare_dates(fromDate, fieldChange['Date'], granularity) in [0, -1]:
+            fieldChangIndex = index
+            previousVal = fieldChanges[index]['From']
+            break
+    if not previousVal:
+        previousVal = fieldChanges[0]['To']
+
+    for i in range(0, numberOfSteps):
+        currentDay = fromDate + step * i
+
+        if compare_dates(fieldChanges[fieldChangIndex]['Date'], currentDay, granularity) == 0:
+            while fieldChangIndex + 1 < len(fieldChanges) and compare_dates(fieldChanges[fieldChangIndex + 1]['Date'], currentDay, granularity) == 0:
+                fieldChangIndex += 1
+            returnArray.append((currentDay, fieldChanges[fieldChangIndex]['To']))
+            previousVal = fieldChanges[fieldChangIndex]['To']
+            if fieldChangIndex + 1 < len(fieldChanges):
+                fieldChangIndex += 1
+        else:
+            returnArray.append((currentDay, previousVal))
+
+    return returnArray
+
+def generate_changes(fromDate: datetime, toDate: datetime, changeCount: int, seed: int = 0):
+    generator = random.Random(seed)
+    states = ["New", "Active", "Resolved", "Closed"]
+    seconds = int((toDate - fromDate).total_seconds())
+    changeDates = sorted(fromDate + timedelta(seconds=generator.randrange(seconds)) for _ in range(changeCount))
+    fieldChanges = []
+    previousState = states[0]
+    for changeDate in changeDates:
+        nextState = generator.choice(states)
+        fieldChanges.append({'From': previousState, 'To': nextState, 'Date': changeDate})
+        previousState = nextState
+    return fieldChanges
+
+def run_case(name: str, loopCall, engineCall, repeat: int):
+    loopSeconds = min(timeit.repeat(loopCall, number=1, repeat=repeat))
+    engineSeconds = min(timeit.repeat(engineCall, number=1, repeat=repeat))
+    print(f"{name:<32} loop: {loopSeconds * 1000:9.2f} ms   engine: {engineSeconds * 1000:9.2f} ms   speedup: {loopSeconds / engineSeconds:6.1f}x")
+
+if __name__ == "__main__":
+    toDate = datetime(2023, 1, 1, 12)
+    yearStart = toDate - timedelta(days=365)
+    monthStart = toDate - timedelta(days=30)
+    hour = timedelta(hours=1)
+
+    yearChanges = generate_changes(yearStart, toDate, 200)
+    run_case("Year, daily, 200 changes",
+             lambda: loop_timeline(yearChanges, yearStart, toDate),
+             lambda: build_timeline(yearChanges, yearStart, toDate), 5)
+
+    monthChanges = generate_changes(monthStart, toDate, 500)
+    run_case("Month, hourly, 500 changes",
+             lambda: loop_timeline(monthChanges, monthStart, toDate, hour, HOUR),
+             lambda: build_timeline(monthChanges, monthStart, toDate, step=hour), 5)
+
+    itemChanges = [generate_changes(yearStart, toDate, 20, seed) for seed in range(500)]
+    run_case("Year, daily, 500 work items",
+             lambda: [loop_timeline(fieldChanges, yearStart, toDate) for fieldChanges in itemChanges],
+             lambda: build_timelines(itemChanges, yearStart, toDate), 3)
@@ -0,0 +1,96 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+class AdapterPool:
+    # Process wide pool of warm adapters for the Flask services, keyed by a hash of the connection details and credentials.
+    # Adapters idle for longer than idleSeconds are dropped, as are the least recently used ones past maxSize.
+
+    def __init__(self, maxSize: int = 32, idleSeconds: float = 600) -> None:
+        self.maxSize = maxSize
+        self.idleSeconds = idleSeconds
+        self.adapters = OrderedDict()
+        self.creationLocks = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"Adapters: {len(self.adapters)}/{self.maxSize}\nIdle Timeout: {self.idleSeconds}s"
+
+    @staticmethod
+    def Get_Key(*keyParts) -> str:
+        return hashlib.sha256(repr(keyParts).encode()).hexdigest()
+
+    def __take(self, key: str):
+        # Caller holds self.lock
+        if key not in self.adapters:
+            return None
+        lastUsed, adapter = self.adapters[key]
+        if time.monotonic() - lastUsed > self.idleSeconds:
+            del self.adapters[key]
+            self.evictions += 1
+            return None
+        self.adapters[key] = (time.monotonic(), adapter)
+        self.adapters.move_to_end(key)
+        return adapter
+
+    def __evict(self):
+        # Caller holds self.lock
+        now = time.monotonic()
+        for key in [key for key, (lastUsed, _) in self.adapters.items() if now - lastUsed > self.idleSeconds]:
+            del self.adapters[key]
+            self.evictions += 1
+        while len(self.adapters) > self.maxSize:
+            self.adapters.popitem(last=False)
+            self.evictions += 1
+
+    def Get_Adapter(self, createAdapter, *keyParts):
+        # createAdapter() builds the adapter on a miss. Concurrent misses on one key build it once; failures propagate and are not pooled.
+        key = self.Get_Key(*keyParts)
+        with self.lock:
+            adapter = self.__take(key)
+            if adapter is not None:
+                self.hits += 1
+                return adapter
+            creationLock = self.creationLocks.setdefault(key, threading.Lock())
+
+        with creationLock:
+            with self.lock:
+                adapter = self.__take(key)
+                if adapter is not None:
+                    self.hits += 1
+                    return adapter
+                self.misses += 1
+
+            try:
+                adapter = createAdapter()
+            except:
+                with self.lock:
+                    self.creationLocks.pop(key, None)
+                raise
+
+            with self.lock:
+                self.creationLocks.pop(key, None)
+                self.adapters[key] = (time.monotonic(), adapter)
+                self.__evict()
+            return adapter
+
+    def Remove(self, *keyParts):
+        with self.lock:
+            self.adapters.pop(self.Get_Key(*keyParts), None)
+
+    def Clear(self):
+        with self.lock:
+            self.adapters.clear()
+
+    def Get_Stats(self) -> dict:
+        with self.lock:
+            return {
+                "Adapters": len(self.adapters),
+                "Hits": self.hits,
+                "Misses": self.misses,
+                "Evictions": self.evictions
+            }
@@ -0,0 +1,192 @@
+import asyncio
+import aiohttp
+import json
+from datetime import datetime
+from workitemAdapter import WorkitemAdapter, ExternalWorkitemInterface
+from retryPolicy import UpstreamRequestError
+
+class AsyncWorkitemAdapter:
+    # Mirrors the WorkitemAdapter surface as coroutines. Connection details, field metadata and response parsing
+    # come from the wrapped synchronous adapter; only the HTTP calls are made here, bounded by maxConcurrency.
+
+    def __init__(self, workitemAdapter: WorkitemAdapter, maxConcurrency: int = 16) -> None:
+        self.workitemAdapter = workitemAdapter
+        self.connectionType = workitemAdapter.connectionType
+        self.baseURL = workitemAdapter.baseURL
+        self.baseWorkitemURL = workitemAdapter.baseWorkitemURL
+        self.maxConcurrency = maxConcurrency
+        self.session = None
+        self.semaphore = None
+
+    def __str__(self) -> str:
+        return f"{self.workitemAdapter}\nMax Concurrency: {self.maxConcurrency}"
+
+    async def __aenter__(self):
+        await self.Open()
+        return self
+
+    async def __aexit__(self, *_):
+        await self.Close()
+
+    async def Open(self):
+        if self.session:
+            return
+        username, password = self.workitemAdapter.credentials
+        self.semaphore = asyncio.Semaphore(self.maxConcurrency)
+        self.session = aiohttp.ClientSession(
+            auth=aiohttp.BasicAuth(username if username else '', password if password else ''),
+            connector=aiohttp.TCPConnector(limit_per_host=self.maxConcurrency),
+            headers={'Accept-Encoding': "gzip, deflate"}
+        )
+
+    async def Close(self):
+        if self.session:
+            await self.session.close()
+        self.session = None
+        self.semaphore = None
+
+    async def __genericRequest(self, url: str, method: str = "GET", jsonData = None):
+        cache = self.workitemAdapter.cache
+        if method == "GET":
+            cachedValue = cache.Get(url, self.workitemAdapter.cacheScope)
+            if cachedValue is not None:
+                return cachedValue
+
+        await self.Open()
+        contentType = self.workitemAdapter.requestContentType if method == "GET" else self.workitemAdapter.postContentType
+        requestHeaders = {'Content-Type': contentType}
+        validator = cache.Get_Validator(url, self.workitemAdapter.cacheScope) if method == "GET" else None
+        if validator:
+            requestHeaders['If-None-Match'] = validator[0]
+        retryPolicy = self.workitemAdapter.retryPolicy
+        bucket = retryPolicy.Get_Bucket(url)
+        acceptedStatuses = (200, 304) if validator else (200,)
+        for attempt in range(0, retryPolicy.maxAttempts):
+            wait = bucket.Reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            async with self.semaphore:
+                async with self.session.request(method, url, json=jsonData, headers=requestHeaders) as r:
+                    retryPolicy.Record_Response(url, r.status, r.headers)
+                    if r.status in acceptedStatuses:
+                        if r.status == 304:
+                            cache.Refresh(url, self.workitemAdapter.cacheScope)
+                            return validator[1]
+                        responseBody = await r.read()
+                        responseValue = json.loads(responseBody)
+                        if method == "GET":
+                            cache.Set(url, self.workitemAdapter.cacheScope, responseValue, len(responseBody), r.headers.get('ETag'))
+                        return responseValue
+
+                    if not retryPolicy.Is_Retryable(r.status) or attempt == retryPolicy.maxAttempts - 1:
+                        raise UpstreamRequestError(url, r.status)
+                    delay = retryPolicy.Get_Delay(attempt, r.headers)
+
+            if delay > retryPolicy.maxRetryAfter:
+                raise UpstreamRequestError(url, r.status, f"Unable to process: {url} (retry after {delay:.0f}s)")
+            print(f"Unable to process: {url} ({r.status}) trying again in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def __genericPostRequest(self, url: str, jsonData):
+        return await self.__genericRequest(url, method="POST", jsonData=jsonData)
+
+    async def __jql_search_request(self, searchString: str):
+        return await self.__genericRequest(f"{self.baseURL}/2/search?jql={searchString}")
+
+    async def Get_Workitem_Response(self, workitemID: str):
+        return await self.__genericRequest(f"{self.baseWorkitemURL}/{workitemID}")
+
+    async def Get_Workitem_Fields(self, workitemID: str):
+        workitemResponse = await self.Get_Workitem_Response(workitemID)
+        if self.connectionType in [ExternalWorkitemInterface.ADO, ExternalWorkitemInterface.JIRA]:
+            return workitemResponse['fields']
+
+    async def Get_Workitem_Associations(self, workitemID: str):
+        if self.connectionType == ExternalWorkitemInterface.ADO:
+            associationResponse = await self.__genericRequest(f"{self.baseWorkitemURL}/{workitemID}?$expand=relations")
+            return self.workitemAdapter.Parse_Workitem_Associations(associationResponse)
+
+        elif self.connectionType == ExternalWorkitemInterface.JIRA:
+            workitemResponse, jqlChildrenSearchResponse = await asyncio.gather(
+                self.Get_Workitem_Response(workitemID),
+                self.__jql_search_request(f"%22Parent%22=%22{workitemID}%22")
+            )
+            return self.workitemAdapter.Parse_Workitem_Associations(workitemResponse, jqlChildrenSearchResponse)
+
+    async def Get_Workitem_Title(self, workitemID: str):
+        return self.workitemAdapter.Parse_Workitem_Title(await self.Get_Workitem_Fields(workitemID))
+
+    async def Get_Workitem_State(self, workitemID: str):
+        return self.workitemAdapter.Parse_Workitem_State(await self.Get_Workitem_Fields(workitemID))
+
+    async def Get_Workitem_Description(self, workitemID: str):
+        return self.workitemAdapter.Parse_Workitem_Description(await self.Get_Workitem_Fields(workitemID))
+
+    async def Get_Workitem_Assignee(self, workitemID: str):
+        return self.workitemAdapter.Parse_Workitem_Assignee(await self.Get_Workitem_Fields(workitemID))
+
+    async def Get_Workitem_Created_Date(self, workitemID: str):
+        return self.workitemAdapter.Parse_Workitem_Created_Date(await self.Get_Workitem_Fields(workitemID))
+
+    async def Get_Workitem_Sprint(self, workitemID: str):
+        return self.workitemAdapter.Parse_Workitem_Sprint(await self.Get_Workitem_Fields(workitemID))
+
+    async def Get_Workitem_History(self, workitemID: str):
+        if self.connectionType == ExternalWorkitemInterface.JIRA:
+            historyResponse = await self.__genericRequest(f"{self.baseWorkitemURL}/{workitemID}?expand=changelog")
+            return historyResponse['changelog']['histories']
+        elif self.connectionType == ExternalWorkitemInterface.ADO:
+            historyResponse = await self.__genericRequest(f"{self.baseWorkitemURL}/{workitemID}/updates")
+            return historyResponse['value']
+
+    async def Get_Workitem_Field_History(self, workitemID: str, field: str, fromDate: datetime = None, toDate: datetime = None, embeddedReturn: list = None):
+        if field not in self.workitemAdapter.fieldList:
+            raise ValueError(f"Unable to find field: {field}")
+
+        workitemFields, historyList = await asyncio.gather(
+            self.Get_Workitem_Fields(workitemID),
+            self.Get_Workitem_History(workitemID)
+        )
+        return self.workitemAdapter.Parse_Workitem_Field_History(workitemFields, historyList, field, fromDate, toDate, embeddedReturn)
+
+    async def Get_Workitems_Field_History(self, workitemIDs: list, field: str, fromDate: datetime = None, toDate: datetime = None, embeddedReturn: list = None) -> list:
+        return await asyncio.gather(*[
+            self.Get_Workitem_Field_History(workitemID, field, fromDate, toDate, embeddedReturn) for workitemID in workitemIDs
+        ])
+
+    async def Get_Children_Field_History(self, workitemID: str, field: str, fromDate: datetime = None, toDate: datetime = None, embeddedReturn: list = None) -> dict:
+        children = (await self.Get_Workitem_Associations(workitemID))['Children']
+        childHistories = await self.Get_Workitems_Field_History(children, field, fromDate, toDate, embeddedReturn)
+        return dict(zip(children, childHistories))
+
+    async def Is_Workitem_ChangedBy(self, workitemID: str, employee: str, fromDate: datetime = None, toDate: datetime = None) -> list:
+        workitemHistory = await self.Get_Workitem_History(workitemID)
+        return self.workitemAdapter.Parse_Workitem_ChangedBy(workitemHistory, employee, fromDate, toDate)
+
+    async def Get_Employee_Contributions(self, employee: str, fromDate: datetime = None, toDate: datetime = None) -> list:
+        workitemIDs = await asyncio.to_thread(lambda: list(self.workitemAdapter.Iterate_Contribution_Candidates(employee, fromDate, toDate)))
+        changeLists = await asyncio.gather(*[
+            self.Is_Workitem_ChangedBy(workitemID, employee, fromDate, toDate) for workitemID in workitemIDs
+        ])
+
+        totalChangeList = []
+        for workitemID, changeList in zip(workitemIDs, changeLists):
+            for changeDate in changeList:
+                totalChangeList.append((workitemID, changeDate))
+        return totalChangeList
+
+    # Single-request listings have nothing to fan out, so they run the synchronous adapter on a worker thread
+    async def Get_Projects(self):
+        return await asyncio.to_thread(self.workitemAdapter.Get_Projects)
+
+    async def Get_Features(self):
+        return await asyncio.to_thread(self.workitemAdapter.Get_Features)
+
+    async def Get_Sprints(self, inputScope: str):
+        return await asyncio.to_thread(self.workitemAdapter.Get_Sprints, inputScope)
+
+    async def Get_Board_or_Teams(self):
+        return await asyncio.to_thread(self.workitemAdapter.Get_Board_or_Teams)
+
+    async def Get_Employees(self):
+        return await asyncio.to_thread(self.workitemAdapter.Get_Employees)
@@ -0,0 +1,14 @@
+import hashlib
+from flask import Response, make_response
+
+def strong_etag(*etagParts) -> str:
+    return hashlib.sha256(repr(etagParts).encode()).hexdigest()[:32]
+
+def conditional_response(request, etag: str, buildPayload):
+    # buildPayload() only runs when the client does not already hold the representation tagged etag
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = make_response(buildPayload())
+    response.set_etag(etag)
+    return response
@@ -0,0 +1,66 @@
+import numpy as np
+from datetime import datetime
+
+isoFormat = "ISO"
+# Tried in order when a source has no known format yet. The strptime formats run on the normalized string.
+dateFormats = [isoFormat, "%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%m/%d/%Y %H:%M:%S", "%m/%d/%Y"]
+isoSuffixStarts = ('.', 'Z', '+', '-')
+
+# Last format that parsed for each source, so a source sticking to one format skips the sniffing
+sourceFormats = {}
+
+def normalize_date_string(dateString: str) -> str:
+    # Seconds precision, offset dropped without converting, matching how the adapters always read dates
+    dateString = dateString.replace('T', ' ')
+    dateString = dateString.replace('Z', '')
+    if '+' in dateString:
+        dateString = dateString[:dateString.find('+')]
+    if '.' in dateString:
+        dateString = dateString[:dateString.find('.')]
+    return dateString
+
+def parse_iso(dateString: str) -> datetime:
+    # yyyy-mm-dd[Thh:mm:ss[.fff][Z|+hh:mm|-hh:mm]] by slicing, so fromisoformat only ever sees the forms every supported Python accepts
+    if len(dateString) < 10 or dateString[4] != '-' or dateString[7] != '-':
+        raise ValueError(f"{dateString} is not an ISO 8601 date")
+    if len(dateString) == 10:
+        return datetime.fromisoformat(dateString)
+    if len(dateString) >= 19 and dateString[10] in ('T', ' ') and (len(dateString) == 19 or dateString[19] in isoSuffixStarts):
+        return datetime.fromisoformat(dateString[:19])
+    if dateString[10] in isoSuffixStarts:
+        return datetime.fromisoformat(dateString[:10])
+    raise ValueError(f"{dateString} is not an ISO 8601 date")
+
+def parse_with_format(dateString: str, dateFormat: str) -> datetime:
+    if dateFormat == isoFormat:
+        return parse_iso(dateString)
+    return datetime.strptime(normalize_date_string(dateString), dateFormat)
+
+def parse_date(dateString: str, source: str = None) -> datetime:
+    cachedFormat = sourceFormats.get(source)
+    if cachedFormat:
+        try:
+            return parse_with_format(dateString, cachedFormat)
+        except ValueError:
+            pass
+
+    for dateFormat in dateFormats:
+        if dateFormat == cachedFormat:
+            continue
+        try:
+            returnDatetime = parse_with_format(dateString, dateFormat)
+        except ValueError:
+            continue
+        if source:
+            sourceFormats[source] = dateFormat
+        return returnDatetime
+
+    raise ValueError(f"Unable to parse date: {dateString}")
+
+def parse_many(dateStrings: list, source: str = None) -> np.ndarray:
+    # Truncating to 19 characters drops fractions and offsets in one pass, then NumPy parses the whole array at once.
+    # Anything NumPy rejects is parsed one at a time instead.
+    try:
+        return np.array(np.array(dateStrings, dtype='U19'), dtype='datetime64[s]')
+    except ValueError:
+        return np.array([parse_date(dateString, source) for dateString in dateStrings], dtype='datetime64[s]')
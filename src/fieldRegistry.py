@@ -0,0 +1,111 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from revisionStore import defaultStoreDirectory
+
+class FieldRegistry:
+    # Field metadata for one connection, indexed by reference name, display name and ID
+
+    def __init__(self, fields: list, referenceKey: str, idKey: str, loadedAt: float = None) -> None:
+        self.fields = fields
+        self.loadedAt = loadedAt if loadedAt else time.time()
+        self.byReference = {field[referenceKey]: field for field in fields}
+        self.byID = {field[idKey]: field for field in fields if idKey in field}
+        self.byName = {}
+        for field in fields:
+            # Display names are not unique across custom fields, the first one listed wins as it did with the old linear scans
+            if 'name' in field:
+                self.byName.setdefault(field['name'], field)
+        self.referenceNames = frozenset(self.byReference)
+        self.idKey = idKey
+
+    def __contains__(self, referenceName: str) -> bool:
+        return referenceName in self.byReference
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def Get_Field(self, identifier: str) -> dict:
+        for index in (self.byReference, self.byID, self.byName):
+            if identifier in index:
+                return index[identifier]
+        return None
+
+    def Get_Field_ID(self, name: str) -> str:
+        field = self.byName.get(name)
+        return field[self.idKey] if field else None
+
+class FieldRegistryCache:
+    # Registries shared by every adapter in the process, one per (connection type, organization, project) scope.
+    # Each registry is loaded once, written to disk and reused until ttlSeconds pass; the least recently used scopes are dropped past maxScopes.
+
+    def __init__(self, directory: str = None, ttlSeconds: float = 24 * 60 * 60, maxScopes: int = 64) -> None:
+        self.directory = directory if directory else os.path.join(defaultStoreDirectory, "fields")
+        self.ttlSeconds = ttlSeconds
+        self.maxScopes = maxScopes
+        self.registries = OrderedDict()
+        self.loads = 0
+        self.lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"Field Registries: {len(self.registries)}/{self.maxScopes}\nDirectory: {self.directory}"
+
+    def __scope_path(self, scope: str) -> str:
+        return os.path.join(self.directory, f"{hashlib.sha256(scope.encode()).hexdigest()[:16]}.json")
+
+    def __read_disk(self, scope: str):
+        try:
+            with open(self.__scope_path(scope), 'r') as jsonFile:
+                diskEntry = json.loads(jsonFile.read())
+        except (OSError, ValueError):
+            return None
+        if diskEntry.get('Scope') != scope or time.time() - diskEntry['Loaded'] > self.ttlSeconds:
+            return None
+        return diskEntry
+
+    def __write_disk(self, scope: str, registry: FieldRegistry):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            scopePath = self.__scope_path(scope)
+            with open(f"{scopePath}.tmp", 'w') as jsonFile:
+                jsonFile.write(json.dumps({'Scope': scope, 'Loaded': registry.loadedAt, 'Fields': registry.fields}))
+            os.replace(f"{scopePath}.tmp", scopePath)
+        except OSError as e:
+            print(f"Unable to cache fields for {scope}\n{e}")
+
+    def Get_Registry(self, scope: str, loadFields, referenceKey: str, idKey: str) -> FieldRegistry:
+        # loadFields() returns the provider's field list and is only called when neither memory nor disk has a fresh copy
+        with self.lock:
+            registry = self.registries.get(scope)
+            if registry and time.time() - registry.loadedAt <= self.ttlSeconds:
+                self.registries.move_to_end(scope)
+                return registry
+
+            diskEntry = self.__read_disk(scope)
+            if diskEntry:
+                registry = FieldRegistry(diskEntry['Fields'], referenceKey, idKey, diskEntry['Loaded'])
+            else:
+                registry = FieldRegistry(loadFields(), referenceKey, idKey)
+                self.loads += 1
+                self.__write_disk(scope, registry)
+
+            self.registries[scope] = registry
+            self.registries.move_to_end(scope)
+            while len(self.registries) > self.maxScopes:
+                self.registries.popitem(last=False)
+            return registry
+
+    def Invalidate(self, scope: str = None):
+        with self.lock:
+            scopes = [scope] if scope else list(self.registries)
+            for invalidScope in scopes:
+                self.registries.pop(invalidScope, None)
+                try:
+                    os.remove(self.__scope_path(invalidScope))
+                except OSError:
+                    pass
+
+defaultFieldRegistries = FieldRegistryCache()
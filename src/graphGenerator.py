@@ -1,5 +1,7 @@
 from workitemAdapter import WorkitemAdapter, ExternalWorkitemInterface
+from asyncWorkitemAdapter import AsyncWorkitemAdapter
 from repoAdapter import RepoAdapter, ExternalRepoInterface
+import asyncio
 import matplotlib.pyplot as plt
 from matplotlib.patches import Patch
 from datetime import datetime, timedelta
@@ -18,21 +20,22 @@ class GraphGenerator:
     def Set_Repo_Adapter(self, repoAdapter: RepoAdapter) -> None:
         self.repoAdapter = repoAdapter
 
+    async def __Gather_Children_Field_History(self, workitemID: str, field: str, fromDate: datetime, toDate: datetime, embeddedReturn: list = None) -> dict:
+        async with AsyncWorkitemAdapter(self.workitemAdapter) as asyncWorkitemAdapter:
+            return await asyncWorkitemAdapter.Get_Children_Field_History(workitemID, field, fromDate, toDate, embeddedReturn)
+
     def Generate_State_Stacked_Area_Chart(self, featureID: str, fromDate: datetime = None, toDate: datetime = None, outputFileName: str = None) -> str:
         if not outputFileName:
             outputFileName = "current_feature_progress.jpg"
         
         adapterExteriorType = self.workitemAdapter.connectionType
-        parentChildrenList = self.workitemAdapter.Get_Workitem_Associations(featureID)['Children']
-        totalStateHistory = []
         if adapterExteriorType == ExternalWorkitemInterface.ADO:
-            for child in parentChildrenList:
-                totalStateHistory.append(self.workitemAdapter.Get_Workitem_Field_History(workitemID=child, field="System.State", fromDate=fromDate, toDate=toDate))
+            childrenStateHistory = asyncio.run(self.__Gather_Children_Field_History(featureID, "System.State", fromDate, toDate))
         elif adapterExteriorType == ExternalWorkitemInterface.JIRA:
-            for child in parentChildrenList:
-                totalStateHistory.append(self.workitemAdapter.Get_Workitem_Field_History(workitemID=child, field="status", fromDate=fromDate, toDate=toDate, embeddedReturn=["statusCategory", "name"]))
+            childrenStateHistory = asyncio.run(self.__Gather_Children_Field_History(featureID, "status", fromDate, toDate, embeddedReturn=["statusCategory", "name"]))
             # TODO: dynamically query state field and see which states this workitem can be assigned
             # TODO: check when a workitem is parented to the parent, instead of assuming all that are currently parented always were
+        totalStateHistory = list(childrenStateHistory.values())
         featureTitle = self.workitemAdapter.Get_Workitem_Title(featureID)
 
         uniqueStates = []
@@ -86,10 +89,11 @@ class GraphGenerator:
         childWidths = []
         childLeft = []
         parentChildrenList = self.workitemAdapter.Get_Workitem_Associations(workitemID)['Children']
+        childSprints = self.workitemAdapter.Get_Workitem_Sprints(parentChildrenList)
         for child in parentChildrenList:
             childList.append(child)
             childWidths.append(1)
-            childLeft.append(sprintList.index(self.workitemAdapter.Get_Workitem_Sprint(child)))
+            childLeft.append(sprintList.index(childSprints[child]))
 
         fig, ax = plt.subplots(1, figsize=(16,6))
 
@@ -0,0 +1,60 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+class HttpTransport:
+    # Owns one pooled keep-alive session so every Get_* call on an adapter reuses the same TCP/TLS connections
+
+    def __init__(self, poolConnections: int = 10, poolMaxSize: int = 10, poolBlock: bool = False, compress: bool = True, timeout: float = None) -> None:
+        self.poolConnections = poolConnections
+        self.poolMaxSize = poolMaxSize
+        self.timeout = timeout
+        self.requestCount = 0
+        self.lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.httpAdapter = HTTPAdapter(pool_connections=poolConnections, pool_maxsize=poolMaxSize, pool_block=poolBlock)
+        self.session.mount("https://", self.httpAdapter)
+        self.session.mount("http://", self.httpAdapter)
+        if compress:
+            self.session.headers['Accept-Encoding'] = "gzip, deflate"
+
+    def __str__(self) -> str:
+        return f"Pooled Hosts: {self.poolConnections}\nConnections Per Host: {self.poolMaxSize}"
+
+    def __count_request(self):
+        with self.lock:
+            self.requestCount += 1
+
+    def Get(self, url: str, headers: dict = None, auth: tuple = None, params: dict = None) -> requests.Response:
+        self.__count_request()
+        return self.session.get(url, headers=headers, auth=auth, params=params, timeout=self.timeout)
+
+    def Post(self, url: str, jsonData, headers: dict = None, auth: tuple = None) -> requests.Response:
+        self.__count_request()
+        return self.session.post(url, json=jsonData, headers=headers, auth=auth, timeout=self.timeout)
+
+    def Get_Pool_Stats(self) -> dict:
+        hostStats = {}
+        poolManager = self.httpAdapter.poolmanager
+        for poolKey in list(poolManager.pools.keys()):
+            pool = poolManager.pools.get(poolKey)
+            if not pool:
+                continue
+            hostStats[f"{poolKey.key_scheme}://{poolKey.key_host}:{poolKey.key_port}"] = {
+                "Requests": pool.num_requests,
+                "Connections Opened": pool.num_connections,
+                "Idle Connections": pool.pool.qsize() if pool.pool else 0
+            }
+
+        poolRequests = sum(host["Requests"] for host in hostStats.values())
+        connectionsOpened = sum(host["Connections Opened"] for host in hostStats.values())
+        return {
+            "Requests": self.requestCount,
+            "Connections Opened": connectionsOpened,
+            "Handshakes Saved": max(poolRequests - connectionsOpened, 0),
+            "Hosts": hostStats
+        }
+
+    def Close(self):
+        self.session.close()
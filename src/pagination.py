@@ -0,0 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+
+def prefetch_pages(fetchPage, firstCursor = None):
+    # fetchPage(cursor) returns (items, nextCursor), with a nextCursor of None on the last page.
+    # The next page is requested in the background while the current one is consumed, so at most two pages are held at once.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pageFuture = executor.submit(fetchPage, firstCursor)
+        while pageFuture:
+            items, nextCursor = pageFuture.result()
+            pageFuture = executor.submit(fetchPage, nextCursor) if nextCursor is not None else None
+            for item in items:
+                yield item
@@ -1,10 +1,18 @@
 from enum import Enum
-import requests
-import time
 from datetime import datetime
 from flask import Flask, request
 import json
 import argparse
+from httpTransport import HttpTransport
+from adapterPool import AdapterPool
+from responseCache import ResponseCache
+from singleFlight import SingleFlight
+from retryPolicy import RetryPolicy, UpstreamRequestError, defaultRetryPolicy
+from concurrent.futures import CancelledError
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from conditionalResponse import strong_etag, conditional_response
+from dateParsing import parse_date, parse_many
+import numpy as np
 
 app = Flask(__name__)
 
@@ -28,10 +36,15 @@ class TimeGranularity(Enum):
 
 class RepoAdapter:
 
-    def __init__(self, connectionType: ExternalRepoInterface, username: str, password: str, organization: str, project: str) -> None:
+    def __init__(self, connectionType: ExternalRepoInterface, username: str, password: str, organization: str, project: str, transport: HttpTransport = None, cache: ResponseCache = None, singleFlight: SingleFlight = None, retryPolicy: RetryPolicy = None) -> None:
         self.connectionType = connectionType
         self.organization = organization
         self.project = project
+        self.transport = transport if transport else HttpTransport()
+        # Listings change with every push, so by default nothing is served from memory without first revalidating its ETag upstream
+        self.cache = cache if cache else ResponseCache(ttlSeconds=0)
+        self.singleFlight = singleFlight if singleFlight else SingleFlight()
+        self.retryPolicy = retryPolicy if retryPolicy else defaultRetryPolicy
 
         if connectionType == ExternalRepoInterface.BITBUCKET:
             self.baseURL = "https://api.bitbucket.org/2.0"
@@ -45,27 +58,37 @@ class RepoAdapter:
             self.baseURL = f"https://api.github.com"
             self.credentials = ('',password)
             self.requestContentType = "application/json-patch+json"
+        self.cacheScope = ResponseCache.Get_Scope(self.credentials)
 
     def __genericRequest(self, url: str, noCredentials = False):
-        goodValue = False
-        for i in range(0, 3):
-
-            r = requests.get(url,
-                headers={'Content-Type': self.requestContentType},
-                auth=None if noCredentials else self.credentials)
-
-            if r.status_code == 200:
-                goodValue = True
-                break
-
-            print(f"Unable to process: {url} trying again")
-            if i != 2:
-                time.sleep(5 + (5 * i))
-
-        if not goodValue:
-            return None
-
-        return r.json()
+        cachedValue = self.cache.Get(url, self.cacheScope)
+        if cachedValue is not None:
+            return cachedValue
+
+        # Identical requests already in flight share one upstream call; a follower that times out or is cancelled fetches on its own
+        try:
+            return self.singleFlight.Do((url, self.cacheScope, noCredentials), lambda: self.__fetch(url, noCredentials))
+        except (FutureTimeoutError, CancelledError):
+            return self.__fetch(url, noCredentials)
+
+    def __fetch(self, url: str, noCredentials: bool):
+        requestHeaders = {'Content-Type': self.requestContentType}
+        validator = self.cache.Get_Validator(url, self.cacheScope)
+        if validator:
+            requestHeaders['If-None-Match'] = validator[0]
+        r = self.retryPolicy.Execute(
+            url,
+            lambda: self.transport.Get(url, headers=requestHeaders, auth=None if noCredentials else self.credentials),
+            (200, 304) if validator else (200,)
+        )
+
+        if r.status_code == 304:
+            self.cache.Refresh(url, self.cacheScope)
+            return validator[1]
+
+        responseValue = r.json()
+        self.cache.Set(url, self.cacheScope, responseValue, len(r.content), r.headers.get('ETag'))
+        return responseValue
 
     def __number_compare(self, num1: int, num2: int):
         if num1 > num2:
@@ -76,29 +99,7 @@ class RepoAdapter:
             return 0
 
     def Str_To_Datetime(self, dateString: str) -> datetime:
-        inputFormat = "%Y-%m-%d %H:%M:%S"
-        dateString = dateString.replace('T', ' ')
-        dateString = dateString.replace('Z', '')
-        if '+' in dateString:
-            dateString = dateString[:dateString.find('+')]
-        if '.' in dateString:
-            dateString = dateString[:dateString.find('.')]
-
-        if '-' in dateString[:6]:
-            try:
-                returnDatetime = datetime.strptime(dateString, inputFormat)
-            except:
-                inputFormat = "%Y-%m-%d"
-                returnDatetime = datetime.strptime(dateString, inputFormat)
-        else:
-            try:
-                inputFormat = "%m/%d/%Y %H:%M:%S"
-                returnDatetime = datetime.strptime(dateString, inputFormat)
-            except:
-                inputFormat = "%m/%d/%Y"
-                returnDatetime = datetime.strptime(dateString, inputFormat)
-
-        return returnDatetime
+        return parse_date(dateString, self.connectionType.name)
 
     def Compare_Dates(self, day1: datetime, day2: datetime, granularity: TimeGranularity = TimeGranularity.DAY):
         yearCompare = self.__number_compare(day1.year, day2.year)
@@ -117,6 +118,18 @@ class RepoAdapter:
     def Connection_Test(self):
         return True # TODO: Actually build out the test
 
+    def Get_Pool_Stats(self) -> dict:
+        return self.transport.Get_Pool_Stats()
+
+    def Get_Cache_Stats(self) -> dict:
+        return self.cache.Get_Stats()
+
+    def Get_Single_Flight_Stats(self) -> dict:
+        return self.singleFlight.Get_Stats()
+
+    def Get_Retry_Stats(self) -> dict:
+        return self.retryPolicy.Get_Stats()
+
     def Get_Repos(self):
         repoList = []
         if self.connectionType == ExternalRepoInterface.BITBUCKET:
@@ -139,6 +152,7 @@ class RepoAdapter:
 
     def Get_Repo_Commits(self, repo: str, fromDate: datetime = None, toDate: datetime = None, committerName: str = None, committerEmail: str = None) -> list:
         commitList = []
+        commitDateStrings = []
         committerName = committerName.lower() if committerName else None
         committerEmail = committerEmail.lower() if committerEmail else None
         if self.connectionType == ExternalRepoInterface.GITHUB:
@@ -147,20 +161,18 @@ class RepoAdapter:
             for commit in commitsResponse:
                 commitCommitterName = commit['commit']['committer']['name'].lower()
                 commitCommitterEmail = commit['commit']['committer']['email'].lower()
-                commitDate = self.Str_To_Datetime(commit['commit']['committer']['date'])
-                if (not fromDate or commitDate > fromDate) and (not toDate or commitDate < toDate) and\
-                (not committerName or committerName == commitCommitterName) and (not committerEmail or commitCommitterEmail == committerEmail):
-                    commitList.append((commit['sha'], commitCommitterName, commitDate))
+                if (not committerName or committerName == commitCommitterName) and (not committerEmail or commitCommitterEmail == committerEmail):
+                    commitList.append((commit['sha'], commitCommitterName))
+                    commitDateStrings.append(commit['commit']['committer']['date'])
         elif self.connectionType == ExternalRepoInterface.ADO:
             url = f"{self.baseURL}/git/repositories/{repo}/commits"
             commitsResponse = self.__genericRequest(url)
             for commit in commitsResponse['value']:
                 commitCommitterName = commit['committer']['name'].lower()
                 commitCommitterEmail = commit['committer']['email'].lower()
-                commitDate = self.Str_To_Datetime(commit['committer']['date'])
-                if (not fromDate or commitDate > fromDate) and (not toDate or commitDate < toDate) and\
-                (not committerName or committerName == commitCommitterName) and (not committerEmail or commitCommitterEmail == committerEmail):
-                    commitList.append((commit['commitId'], commitCommitterName, commitDate))
+                if (not committerName or committerName == commitCommitterName) and (not committerEmail or commitCommitterEmail == committerEmail):
+                    commitList.append((commit['commitId'], commitCommitterName))
+                    commitDateStrings.append(commit['committer']['date'])
         elif self.connectionType == ExternalRepoInterface.BITBUCKET:
             url = f"{self.baseURL}/repositories/{self.organization}/{repo}/commits"
             commitsResponse = self.__genericRequest(url, noCredentials=True)
@@ -168,27 +180,51 @@ class RepoAdapter:
                 commitCommitterName = commit['author']['user']['display_name'].lower()
                 commitCommitterRaw = commit['author']['raw']
                 commitCommitterEmail = commitCommitterRaw[commitCommitterRaw.find('<') + 1:commitCommitterRaw.find('>')]
-                commitDate = self.Str_To_Datetime(commit['date'])
-                if (not fromDate or commitDate > fromDate) and (not toDate or commitDate < toDate) and\
-                (not committerName or committerName == commitCommitterName) and (not committerEmail or commitCommitterEmail == committerEmail):
-                    commitList.append((commit['hash'], commitCommitterName, commitDate))
+                if (not committerName or committerName == commitCommitterName) and (not committerEmail or commitCommitterEmail == committerEmail):
+                    commitList.append((commit['hash'], commitCommitterName))
+                    commitDateStrings.append(commit['date'])
+
+        # Dates for the whole page are parsed and range checked in one pass
+        commitDates = parse_many(commitDateStrings, self.connectionType.name)
+        inRange = np.ones(len(commitDates), dtype=bool)
+        if fromDate:
+            inRange &= commitDates > np.datetime64(fromDate)
+        if toDate:
+            inRange &= commitDates < np.datetime64(toDate)
+        commitList = [(sha, name, commitDate) for (sha, name), commitDate, keep in zip(commitList, commitDates.astype(object), inRange) if keep]
 
         commitList = commitList[::-1]
 
         return commitList
 
+servicePool = AdapterPool()
+serviceSingleFlight = SingleFlight()
+
+@app.errorhandler(UpstreamRequestError)
+def handle_upstream_error(error: UpstreamRequestError):
+    # Client errors from the provider pass through as is, anything else is reported as a bad gateway
+    statusCode = error.statusCode if error.statusCode and error.statusCode < 500 else 502
+    return({
+        "Message": str(error),
+        "Status": statusCode
+    }, statusCode)
+
 def initialize(request) -> RepoAdapter:
     requestData = request.data
     if not len(requestData) == 0:
         requestData = json.loads(request.data.decode())
     else:
         requestData = request.form
-    return RepoAdapter(
-        ExternalRepoInterface.ADO,
-        requestData['username'],
-        requestData['pat'],
-        requestData['org'],
-        requestData['project']
+    return servicePool.Get_Adapter(
+        lambda: RepoAdapter(
+            ExternalRepoInterface.ADO,
+            requestData['username'],
+            requestData['pat'],
+            requestData['org'],
+            requestData['project'],
+            singleFlight=serviceSingleFlight
+        ),
+        ExternalRepoInterface.ADO.name, requestData['org'], requestData['project'], requestData['username'], requestData['pat']
     )
 
 @app.route("/init", methods=['GET'])
@@ -221,8 +257,9 @@ def route_getRepos():
     if not thisRepoAdapter:
         return(badRequestReturn)
 
-    return({
-        "Values": thisRepoAdapter.Get_Repos(),
+    repoList = thisRepoAdapter.Get_Repos()
+    return conditional_response(request, strong_etag(thisRepoAdapter.baseURL, repoList), lambda: {
+        "Values": repoList,
         "Status": 200
     })
 
@@ -233,8 +270,10 @@ def route_getRepoCommits(repoName):
     if not thisRepoAdapter:
         return(badRequestReturn)
 
-    return({
-        "Values": thisRepoAdapter.Get_Repo_Commits(repo=repoName, fromDate=None, toDate=None, committerName=None, committerEmail=None),
+    commitList = thisRepoAdapter.Get_Repo_Commits(repo=repoName, fromDate=None, toDate=None, committerName=None, committerEmail=None)
+    latestCommit = commitList[-1][0] if commitList else None
+    return conditional_response(request, strong_etag(thisRepoAdapter.baseURL, repoName, latestCommit, len(commitList)), lambda: {
+        "Values": commitList,
         "Status": 200
     })
 
@@ -0,0 +1,100 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+class ResponseCache:
+    # Thread safe TTL + LRU cache of decoded JSON responses, keyed by (url, credentials scope).
+    # Cached values are shared between callers, so they must be treated as read only.
+    # Expired entries that carry an ETag are kept, so the next request can revalidate them upstream instead of downloading again.
+
+    def __init__(self, ttlSeconds: float = 300, maxEntries: int = 2048, maxBytes: int = 64 * 1024 * 1024) -> None:
+        self.ttlSeconds = ttlSeconds
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.entries = OrderedDict()
+        self.currentBytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+        self.lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"Entries: {len(self.entries)}/{self.maxEntries}\nBytes: {self.currentBytes}/{self.maxBytes}"
+
+    @staticmethod
+    def Get_Scope(credentials) -> str:
+        return hashlib.sha256(repr(credentials).encode()).hexdigest()[:16]
+
+    def __remove(self, key):
+        _, size, _, _ = self.entries.pop(key)
+        self.currentBytes -= size
+
+    def Get(self, url: str, scope: str):
+        key = (url, scope)
+        with self.lock:
+            if key in self.entries:
+                expires, _, value, etag = self.entries[key]
+                if expires > time.monotonic():
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                if not etag:
+                    self.__remove(key)
+            self.misses += 1
+            return None
+
+    def Get_Validator(self, url: str, scope: str):
+        # Returns (etag, value) for a cached response that can be revalidated, fresh or not
+        with self.lock:
+            entry = self.entries.get((url, scope))
+            if not entry or not entry[3]:
+                return None
+            return entry[3], entry[2]
+
+    def Refresh(self, url: str, scope: str):
+        # The upstream answered 304 Not Modified, so the cached value is good for another ttlSeconds
+        key = (url, scope)
+        with self.lock:
+            if key in self.entries:
+                _, size, value, etag = self.entries[key]
+                self.entries[key] = (time.monotonic() + self.ttlSeconds, size, value, etag)
+                self.entries.move_to_end(key)
+                self.revalidations += 1
+
+    def Set(self, url: str, scope: str, value, size: int = 0, etag: str = None):
+        if value is None or size > self.maxBytes:
+            return
+        key = (url, scope)
+        with self.lock:
+            if key in self.entries:
+                self.__remove(key)
+            self.entries[key] = (time.monotonic() + self.ttlSeconds, size, value, etag)
+            self.currentBytes += size
+            while len(self.entries) > self.maxEntries or self.currentBytes > self.maxBytes:
+                self.__remove(next(iter(self.entries)))
+                self.evictions += 1
+
+    def Invalidate(self, url: str = None):
+        # Drops the resource at url along with its sub resources and query variants, or everything when no url is given
+        with self.lock:
+            if url is None:
+                self.entries.clear()
+                self.currentBytes = 0
+                return
+            for key in [key for key in self.entries if key[0] == url or key[0].startswith((f"{url}/", f"{url}?"))]:
+                self.__remove(key)
+
+    def Get_Stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "Entries": len(self.entries),
+                "Bytes": self.currentBytes,
+                "Hits": self.hits,
+                "Misses": self.misses,
+                "Evictions": self.evictions,
+                "Revalidations": self.revalidations,
+                "Hit Rate": self.hits / lookups if lookups else 0.0
+            }
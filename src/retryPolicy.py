@@ -0,0 +1,183 @@
+import random
+import threading
+import time
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+import requests
+
+class UpstreamRequestError(Exception):
+    # Raised once a request has failed for good, instead of handing None back to the caller
+
+    def __init__(self, url: str, statusCode: int = None, message: str = None) -> None:
+        self.url = url
+        self.statusCode = statusCode
+        super().__init__(message if message else f"Unable to process: {url} (status {statusCode})")
+
+class TokenBucket:
+    # Per host request budget shared by every thread. The rate halves whenever the host pushes back and climbs back towards
+    # maxRate as requests succeed, so bulk crawls settle at the fastest rate the host accepts.
+
+    def __init__(self, maxRate: float, capacity: float, minRate: float = 0.5) -> None:
+        self.maxRate = maxRate
+        self.minRate = minRate
+        self.rate = maxRate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.pausedUntil = 0.0
+        self.lock = threading.Lock()
+
+    def Reserve(self) -> float:
+        # Takes a token and returns how long to wait before using it
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.pausedUntil - now)
+
+    def Acquire(self):
+        wait = self.Reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def Pause_Until(self, until: float):
+        with self.lock:
+            self.pausedUntil = max(self.pausedUntil, until)
+
+    def Slow_Down(self):
+        with self.lock:
+            self.rate = max(self.minRate, self.rate / 2)
+
+    def Speed_Up(self):
+        with self.lock:
+            self.rate = min(self.maxRate, self.rate + self.maxRate / 20)
+
+class RetryPolicy:
+    # Decides whether and when to retry, from the status class and the provider's Retry-After and rate limit headers
+
+    retryableStatuses = frozenset([408, 429, 500, 502, 503, 504])
+    throttleStatuses = frozenset([429, 503])
+
+    def __init__(self, maxAttempts: int = 4, baseDelay: float = 0.5, maxDelay: float = 30, maxRetryAfter: float = 120,
+                 hostRate: float = 20, hostBurst: float = 40) -> None:
+        self.maxAttempts = maxAttempts
+        self.baseDelay = baseDelay
+        self.maxDelay = maxDelay
+        self.maxRetryAfter = maxRetryAfter
+        self.hostRate = hostRate
+        self.hostBurst = hostBurst
+        self.buckets = {}
+        self.retries = 0
+        self.lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"Max Attempts: {self.maxAttempts}\nHost Rate: {self.hostRate}/s"
+
+    def Get_Bucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.hostRate, self.hostBurst)
+            return self.buckets[host]
+
+    def Is_Retryable(self, statusCode: int) -> bool:
+        return statusCode in self.retryableStatuses
+
+    def Get_Backoff(self, attempt: int) -> float:
+        # Full jitter keeps threads that failed together from retrying together
+        return random.uniform(0, min(self.maxDelay, self.baseDelay * (2 ** attempt)))
+
+    @staticmethod
+    def Parse_Retry_After(value: str) -> float:
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def Parse_Rate_Limit_Reset(value: str) -> float:
+        # GitHub and ADO send epoch seconds, Jira an ISO 8601 timestamp; returns seconds from now
+        if not value:
+            return None
+        try:
+            return max(float(value) - time.time(), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp() - time.time(), 0.0)
+        except ValueError:
+            return None
+
+    def Get_Server_Delay(self, headers) -> float:
+        # The wait the host asked for, if any
+        retryAfter = self.Parse_Retry_After(headers.get('Retry-After'))
+        if retryAfter is not None:
+            return retryAfter
+        if headers.get('X-RateLimit-Remaining') == '0':
+            return self.Parse_Rate_Limit_Reset(headers.get('X-RateLimit-Reset'))
+        return None
+
+    def Get_Delay(self, attempt: int, headers = None) -> float:
+        serverDelay = self.Get_Server_Delay(headers) if headers is not None else None
+        return serverDelay if serverDelay is not None else self.Get_Backoff(attempt)
+
+    def Record_Response(self, url: str, statusCode: int, headers):
+        bucket = self.Get_Bucket(url)
+        isThrottled = statusCode in self.throttleStatuses
+        if isThrottled:
+            bucket.Slow_Down()
+        elif statusCode < 400:
+            bucket.Speed_Up()
+        # Throttled or out of budget, so hold every thread talking to this host until the window resets
+        if isThrottled or headers.get('X-RateLimit-Remaining') == '0':
+            serverDelay = self.Get_Server_Delay(headers)
+            if serverDelay is not None:
+                bucket.Pause_Until(time.monotonic() + min(serverDelay, self.maxRetryAfter))
+
+    def Execute(self, url: str, sendRequest, acceptedStatuses = (200,)):
+        # sendRequest() performs one attempt and returns a requests.Response; the accepted response is returned, anything else raises
+        bucket = self.Get_Bucket(url)
+        for attempt in range(0, self.maxAttempts):
+            bucket.Acquire()
+            try:
+                r = sendRequest()
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.maxAttempts - 1:
+                    raise UpstreamRequestError(url, message=f"Unable to process: {url} ({e})") from e
+                self.__wait(self.Get_Backoff(attempt))
+                continue
+
+            self.Record_Response(url, r.status_code, r.headers)
+            if r.status_code in acceptedStatuses:
+                return r
+            if not self.Is_Retryable(r.status_code) or attempt == self.maxAttempts - 1:
+                raise UpstreamRequestError(url, r.status_code)
+
+            delay = self.Get_Delay(attempt, r.headers)
+            if delay > self.maxRetryAfter:
+                raise UpstreamRequestError(url, r.status_code, f"Unable to process: {url} (retry after {delay:.0f}s)")
+            print(f"Unable to process: {url} ({r.status_code}) trying again in {delay:.1f}s")
+            self.__wait(delay)
+
+    def __wait(self, delay: float):
+        with self.lock:
+            self.retries += 1
+        time.sleep(delay)
+
+    def Get_Stats(self) -> dict:
+        with self.lock:
+            return {
+                "Retries": self.retries,
+                "Hosts": {host: {"Rate": bucket.rate, "Paused For": max(bucket.pausedUntil - time.monotonic(), 0.0)} for host, bucket in self.buckets.items()}
+            }
+
+defaultRetryPolicy = RetryPolicy()
@@ -0,0 +1,66 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+defaultStoreDirectory = os.path.join(os.path.expanduser("~"), ".automatedmetrics")
+
+class RevisionStore:
+    # On disk store of work item revisions in chronological order, plus the per scope high water mark of the last sync
+
+    def __init__(self, path: str = None, syncOverlap: timedelta = timedelta(days=1)) -> None:
+        if not path:
+            os.makedirs(defaultStoreDirectory, exist_ok=True)
+            path = os.path.join(defaultStoreDirectory, "revisions.db")
+        self.path = path
+        self.syncOverlap = syncOverlap
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS workitems (scope TEXT, workitemID TEXT, revisionCount INTEGER, lastSynced TEXT, PRIMARY KEY (scope, workitemID))")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS revisions (scope TEXT, workitemID TEXT, revisionIndex INTEGER, revision TEXT, PRIMARY KEY (scope, workitemID, revisionIndex))")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS syncState (scope TEXT PRIMARY KEY, highWater TEXT)")
+
+    def __str__(self) -> str:
+        return f"Revision Store: {self.path}"
+
+    def Get_Revisions(self, scope: str, workitemID: str):
+        with self.lock:
+            if not self.connection.execute("SELECT 1 FROM workitems WHERE scope = ? AND workitemID = ?", (scope, str(workitemID))).fetchone():
+                return None
+            rows = self.connection.execute(
+                "SELECT revision FROM revisions WHERE scope = ? AND workitemID = ? ORDER BY revisionIndex", (scope, str(workitemID))
+            ).fetchall()
+        return [json.loads(revision) for revision, in rows]
+
+    def Get_Revision_Count(self, scope: str, workitemID: str) -> int:
+        with self.lock:
+            row = self.connection.execute("SELECT revisionCount FROM workitems WHERE scope = ? AND workitemID = ?", (scope, str(workitemID))).fetchone()
+        return row[0] if row else 0
+
+    def Append_Revisions(self, scope: str, workitemID: str, revisions: list):
+        workitemID = str(workitemID)
+        with self.lock, self.connection:
+            row = self.connection.execute("SELECT revisionCount FROM workitems WHERE scope = ? AND workitemID = ?", (scope, workitemID)).fetchone()
+            revisionCount = row[0] if row else 0
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO revisions VALUES (?, ?, ?, ?)",
+                [(scope, workitemID, revisionCount + index, json.dumps(revision)) for index, revision in enumerate(revisions)]
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO workitems VALUES (?, ?, ?, ?)",
+                (scope, workitemID, revisionCount + len(revisions), datetime.utcnow().isoformat())
+            )
+
+    def Get_High_Water(self, scope: str) -> datetime:
+        with self.lock:
+            row = self.connection.execute("SELECT highWater FROM syncState WHERE scope = ?", (scope,)).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def Set_High_Water(self, scope: str, highWater: datetime):
+        with self.lock, self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO syncState VALUES (?, ?)", (scope, highWater.isoformat()))
+
+    def Close(self):
+        self.connection.close()
@@ -0,0 +1,80 @@
+import threading
+from concurrent.futures import Future, InvalidStateError
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+class SingleFlight:
+    # Coalesces concurrent calls for the same key: the first caller runs the request and everyone arriving while it is in flight
+    # shares its result. Followers give up after their timeout, or when the key is cancelled, without affecting the leader.
+
+    def __init__(self, timeout: float = 60) -> None:
+        self.timeout = timeout
+        self.calls = {}
+        self.leaders = 0
+        self.shared = 0
+        self.timeouts = 0
+        self.cancellations = 0
+        self.lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"In Flight: {len(self.calls)}\nTimeout: {self.timeout}s"
+
+    def Do(self, key, function, timeout: float = None):
+        # Raises concurrent.futures TimeoutError or CancelledError to a follower whose wait ends without a result
+        with self.lock:
+            call = self.calls.get(key)
+            isLeader = call is None
+            if isLeader:
+                call = Future()
+                self.calls[key] = call
+                self.leaders += 1
+
+        if not isLeader:
+            try:
+                result = call.result(timeout=self.timeout if timeout is None else timeout)
+            except FutureTimeoutError:
+                with self.lock:
+                    self.timeouts += 1
+                raise
+            with self.lock:
+                self.shared += 1
+            return result
+
+        try:
+            result = function()
+        except BaseException as e:
+            self.__finish(key, call, exception=e)
+            raise
+        self.__finish(key, call, result=result)
+        return result
+
+    def __finish(self, key, call: Future, result = None, exception: BaseException = None):
+        with self.lock:
+            if self.calls.get(key) is call:
+                del self.calls[key]
+        try:
+            if exception is not None:
+                call.set_exception(exception)
+            else:
+                call.set_result(result)
+        except InvalidStateError:
+            # Cancelled while in flight, the followers have already been released
+            pass
+
+    def Cancel(self, key) -> bool:
+        # Releases everyone waiting on key with CancelledError; later callers start a fresh request
+        with self.lock:
+            call = self.calls.pop(key, None)
+            if call is None:
+                return False
+            self.cancellations += 1
+        return call.cancel()
+
+    def Get_Stats(self) -> dict:
+        with self.lock:
+            return {
+                "In Flight": len(self.calls),
+                "Leaders": self.leaders,
+                "Shared": self.shared,
+                "Timeouts": self.timeouts,
+                "Cancellations": self.cancellations
+            }
@@ -0,0 +1,49 @@
+import numpy as np
+from datetime import datetime, timedelta
+
+def to_microseconds(dates) -> np.ndarray:
+    return np.array(dates, dtype='datetime64[us]').astype(np.int64)
+
+def timeline_steps(fromDate: datetime, toDate: datetime, step: timedelta = timedelta(days=1)) -> np.ndarray:
+    # Same sampling as the original day loop: every step from fromDate, plus one more when toDate lands part way into a step
+    stepCount = (toDate - fromDate) // step + 1
+    if (toDate - fromDate) % step >= timedelta(seconds=1):
+        stepCount += 1
+    return np.datetime64(fromDate, 'us') + np.arange(max(stepCount, 0)) * np.timedelta64(step)
+
+def build_timelines(fieldChangesList: list, fromDate: datetime, toDate: datetime, initialValues: list = None, step: timedelta = timedelta(days=1)):
+    # fieldChangesList holds one list of {'From', 'To', 'Date'} changes per work item, in any order.
+    # Returns the sampled steps and a (work items x steps) object array of the value held on each step.
+    steps = timeline_steps(fromDate, toDate, step)
+    stepMicroseconds = step // timedelta(microseconds=1)
+    stepKeys = steps.astype(np.int64) // stepMicroseconds
+    values = np.empty((len(fieldChangesList), len(steps)), dtype=object)
+
+    for row, fieldChanges in enumerate(fieldChangesList):
+        initialValue = initialValues[row] if initialValues else None
+        if len(fieldChanges) == 0:
+            values[row].fill(initialValue)
+            continue
+
+        changeMicroseconds = to_microseconds([fieldChange['Date'] for fieldChange in fieldChanges])
+        order = np.argsort(changeMicroseconds, kind='stable')
+        changeKeys = changeMicroseconds[order] // stepMicroseconds
+        toValues = np.empty(len(fieldChanges), dtype=object)
+        for position, index in enumerate(order):
+            toValues[position] = fieldChanges[index]['To']
+
+        # Last change in each bucket wins, then every step takes the latest bucket at or before it
+        bucketEnds = np.flatnonzero(np.append(changeKeys[1:] != changeKeys[:-1], True))
+        bucketIndex = np.searchsorted(changeKeys[bucketEnds], stepKeys, side='right') - 1
+
+        firstChange = fieldChanges[order[0]]
+        beforeValue = firstChange['From'] if firstChange['From'] else firstChange['To']
+        values[row].fill(beforeValue)
+        changed = bucketIndex >= 0
+        values[row, changed] = toValues[bucketEnds[bucketIndex[changed]]]
+
+    return steps, values
+
+def build_timeline(fieldChanges: list, fromDate: datetime, toDate: datetime, initialValue = None, step: timedelta = timedelta(days=1)):
+    steps, values = build_timelines([fieldChanges], fromDate, toDate, [initialValue], step)
+    return steps, values[0]
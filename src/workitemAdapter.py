@@ -1,10 +1,24 @@
 from enum import Enum
-import requests
-import time
 from datetime import datetime, timedelta
-from flask import Flask, request
+from flask import Flask, Response, request, stream_with_context
 import argparse
 import json
+from urllib.parse import quote
+from httpTransport import HttpTransport
+from responseCache import ResponseCache
+from singleFlight import SingleFlight
+from retryPolicy import RetryPolicy, UpstreamRequestError, defaultRetryPolicy
+from revisionStore import RevisionStore
+from adapterPool import AdapterPool
+from conditionalResponse import strong_etag, conditional_response
+from fieldRegistry import FieldRegistry, FieldRegistryCache, defaultFieldRegistries
+from pagination import prefetch_pages
+from concurrent.futures import ThreadPoolExecutor, as_completed, CancelledError
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from timelineEngine import build_timeline
+from dateParsing import parse_date, parse_many
+import numpy as np
+import copy
 
 app = Flask(__name__)
 
@@ -27,40 +41,65 @@ class TimeGranularity(Enum):
     YEAR = 0
 
 class WorkitemAdapter:
-    fieldList = []
-    fieldDataList = []
+    adoBatchSize = 200
+    jiraBatchSize = 100
+    adoUpdatesPageSize = 200
+    adoWiqlPageSize = 1000
+    jiraChangelogPageSize = 100
+    jiraSearchPageSize = 100
+    jiraUserPageSize = 1000
     
-    def __init__(self, connectionType: ExternalWorkitemInterface, username: str, password: str, organization: str, project: str = None) -> None:
+    def __init__(self, connectionType: ExternalWorkitemInterface, username: str, password: str, organization: str, project: str = None, transport: HttpTransport = None, cache: ResponseCache = None, revisionStore: RevisionStore = None, fieldRegistries: FieldRegistryCache = None, singleFlight: SingleFlight = None, retryPolicy: RetryPolicy = None) -> None:
         self.connectionType = connectionType
         self.username = username
         self.password = password
         self.organization = organization
         self.project = project
+        self.transport = transport if transport else HttpTransport()
+        self.cache = cache if cache else ResponseCache()
+        self.singleFlight = singleFlight if singleFlight else SingleFlight()
+        self.retryPolicy = retryPolicy if retryPolicy else defaultRetryPolicy
+        self.revisionStore = revisionStore
+        self.storeScope = f"{connectionType.name}:{organization}:{project}"
+        self.fieldRegistries = fieldRegistries if fieldRegistries else defaultFieldRegistries
 
         if self.connectionType == ExternalWorkitemInterface.ADO:
             self.baseURL = f"https://dev.azure.com/{organization}/{project}/_apis"
             self.baseWorkitemURL = f"{self.baseURL}/wit/workitems"
             self.testURL = f"{self.baseURL}/wit/fields"
             self.credentials = ('',self.password)
+            self.cacheScope = ResponseCache.Get_Scope(self.credentials)
             self.requestContentType = "application/json-patch+json"
             self.postContentType = "application/json"
-            for fieldEntry in self.__genericRequest(f"{self.testURL}")['value']:
-                self.fieldList.append(fieldEntry['referenceName'])
-                self.fieldDataList.append(fieldEntry)
+            self.fieldRegistry = self.fieldRegistries.Get_Registry(
+                self.storeScope, lambda: self.__genericRequest(f"{self.testURL}", useCache=False)['value'], 'referenceName', 'referenceName'
+            )
 
         if self.connectionType == ExternalWorkitemInterface.JIRA:
             self.baseURL = f"https://{organization}.atlassian.net/rest/api"
             self.baseWorkitemURL = f"{self.baseURL}/2/issue"
             self.testURL = f"{self.baseURL}/2/permissions"
             self.credentials = (self.username, self.password)
+            self.cacheScope = ResponseCache.Get_Scope(self.credentials)
             self.requestContentType = "application/json"
             self.postContentType = "application/json"
-            for fieldEntry in self.__genericRequest(f"{self.baseURL}/latest/field"):
-                self.fieldList.append(fieldEntry['key'])
-                self.fieldDataList.append(fieldEntry)
+            self.fieldRegistry = self.fieldRegistries.Get_Registry(
+                self.storeScope, lambda: self.__genericRequest(f"{self.baseURL}/latest/field", useCache=False), 'key', 'id'
+            )
+
+    @property
+    def fieldList(self):
+        return self.fieldRegistry.referenceNames
+
+    @property
+    def fieldDataList(self):
+        return self.fieldRegistry.fields
 
     def connection_test(self):
-        testResponse = self.__genericRequest(self.testURL)
+        try:
+            testResponse = self.__genericRequest(self.testURL, useCache=False)
+        except UpstreamRequestError:
+            return False
         if testResponse:
             return True
         else:
@@ -69,75 +108,111 @@ class WorkitemAdapter:
     def __str__(self) -> str:
         return f"Connection Type: {self.connectionType.name}\nConnection URL: {self.baseURL}"
 
-    def __genericRequest(self, url: str):
-        goodValue = False
-        for i in range(0, 3):
-            r = requests.get(url,
-                headers={'Content-Type': self.requestContentType},
-                auth=self.credentials)
+    def Get_Pool_Stats(self) -> dict:
+        return self.transport.Get_Pool_Stats()
 
-            if r.status_code == 200:
-                goodValue = True
-                break
+    def Get_Cache_Stats(self) -> dict:
+        return self.cache.Get_Stats()
 
-            print(f"Unable to process: {url} trying again")
-            if i != 2:
-                time.sleep(5 + (5 * i))
+    def Get_Single_Flight_Stats(self) -> dict:
+        return self.singleFlight.Get_Stats()
 
-        if not goodValue:
-            return None
+    def Get_Retry_Stats(self) -> dict:
+        return self.retryPolicy.Get_Stats()
 
-        return r.json()
+    def Invalidate_Cache(self, workitemID: str = None):
+        self.cache.Invalidate(f"{self.baseWorkitemURL}/{workitemID}" if workitemID else None)
+
+    def __genericResponse(self, url: str, etag: str = None):
+        requestHeaders = {'Content-Type': self.requestContentType}
+        if etag:
+            requestHeaders['If-None-Match'] = etag
+        return self.retryPolicy.Execute(
+            url,
+            lambda: self.transport.Get(url, headers=requestHeaders, auth=self.credentials),
+            (200, 304) if etag else (200,)
+        )
+
+    def __genericRequest(self, url: str, useCache: bool = True):
+        if useCache:
+            cachedValue = self.cache.Get(url, self.cacheScope)
+            if cachedValue is not None:
+                return cachedValue
+
+        # Identical requests already in flight share one upstream call; a follower that times out or is cancelled fetches on its own
+        try:
+            return self.singleFlight.Do((url, self.cacheScope, useCache), lambda: self.__fetch(url, useCache))
+        except (FutureTimeoutError, CancelledError):
+            return self.__fetch(url, useCache)
+
+    def __fetch(self, url: str, useCache: bool):
+        validator = self.cache.Get_Validator(url, self.cacheScope) if useCache else None
+        r = self.__genericResponse(url, validator[0] if validator else None)
+        if r.status_code == 304:
+            self.cache.Refresh(url, self.cacheScope)
+            return validator[1]
+
+        responseValue = r.json()
+        if useCache:
+            self.cache.Set(url, self.cacheScope, responseValue, len(r.content), r.headers.get('ETag'))
+        return responseValue
         
     def __jql_search_request(self, searchString: str):
-        url = f"{self.baseURL}/2/search?jql={searchString}"
-        return self.__genericRequest(url)
+        return {"issues": list(self.Iterate_Jql_Search(searchString))}
 
     def __genericPostRequest(self, url: str, jsonData):
-        goodValue = False
-        for i in range(0, 3):
-            r = requests.post(url,
-                json=jsonData,
-                headers={'Content-Type': self.postContentType},
-                auth=self.credentials)
-
-            if r.status_code == 200:
-                goodValue = True
-                break
+        r = self.retryPolicy.Execute(
+            url,
+            lambda: self.transport.Post(url, jsonData, headers={'Content-Type': self.postContentType}, auth=self.credentials)
+        )
+        return r.json()
+        
+    def Iterate_Jql_Search(self, jql: str, fields: list = None):
+        fieldsParameter = f"&fields={','.join(fields)}" if fields else ""
+
+        def fetch_page(startAt: int):
+            searchURL = f"{self.baseURL}/2/search?jql={quote(jql, safe='=')}&startAt={startAt}&maxResults={self.jiraSearchPageSize}{fieldsParameter}"
+            searchResponse = self.__genericRequest(searchURL, useCache=False)
+            issues = searchResponse['issues']
+            nextStartAt = startAt + len(issues)
+            isLast = len(issues) == 0 or searchResponse.get('isLast', False) or nextStartAt >= searchResponse.get('total', nextStartAt)
+            return issues, None if isLast else nextStartAt
+
+        return prefetch_pages(fetch_page, 0)
+
+    def Iterate_Wiql_Query(self, whereCondition: str = None):
+        # WIQL has no continuation token, so pages are keyed on the last work item ID seen
+        def fetch_page(lastWorkitemID: str):
+            conditions = [f"[System.Id] > {lastWorkitemID}"]
+            if whereCondition:
+                conditions.append(f"({whereCondition})")
+            queryData = {
+                            "query": f"SELECT [System.Id] FROM workitems WHERE {' AND '.join(conditions)} ORDER BY [System.Id]"
+                        }
+            queryResponse = self.__genericPostRequest(f"{self.baseURL}/wit/wiql?timePrecision=true&$top={self.adoWiqlPageSize}&api-version=7.1-preview.2", queryData)
+            workitemIDs = [str(workitem['id']) for workitem in queryResponse.get('workItems', [])]
+            return workitemIDs, workitemIDs[-1] if len(workitemIDs) == self.adoWiqlPageSize else None
 
-            print(f"Unable to process: {url} trying again")
-            if i != 2:
-                time.sleep(5 + (5 * i))
+        return prefetch_pages(fetch_page, 0)
 
-        if not goodValue:
-            return None
+    def Iterate_Employees(self):
+        if self.connectionType == ExternalWorkitemInterface.JIRA:
+            def fetch_page(startAt: int):
+                users = self.__genericRequest(f"{self.baseURL}/2/users/search?startAt={startAt}&maxResults={self.jiraUserPageSize}", useCache=False)
+                return users, startAt + len(users) if len(users) == self.jiraUserPageSize else None
 
-        return r.json()
-        
-    def Str_To_Datetime(self, dateString: str) -> datetime:
-        inputFormat = "%Y-%m-%d %H:%M:%S"
-        dateString = dateString.replace('T', ' ')
-        dateString = dateString.replace('Z', '')
-        if '+' in dateString:
-            dateString = dateString[:dateString.find('+')]
-        if '.' in dateString:
-            dateString = dateString[:dateString.find('.')]
-
-        if '-' in dateString[:6]:
-            try:
-                returnDatetime = datetime.strptime(dateString, inputFormat)
-            except:
-                inputFormat = "%Y-%m-%d"
-                returnDatetime = datetime.strptime(dateString, inputFormat)
-        else:
-            try:
-                inputFormat = "%m/%d/%Y %H:%M:%S"
-                returnDatetime = datetime.strptime(dateString, inputFormat)
-            except:
-                inputFormat = "%m/%d/%Y"
-                returnDatetime = datetime.strptime(dateString, inputFormat)
+        elif self.connectionType == ExternalWorkitemInterface.ADO:
+            def fetch_page(continuationToken: str):
+                url = f"https://vssps.dev.azure.com/{self.organization}/_apis/graph/users?api-version=7.0-preview.1" #TODO Currently works in Chrome and not in requests
+                if continuationToken:
+                    url += f"&continuationToken={quote(continuationToken)}"
+                r = self.__genericResponse(url)
+                return r.json()['value'], r.headers.get('x-ms-continuationtoken')
 
-        return returnDatetime
+        return prefetch_pages(fetch_page, None if self.connectionType == ExternalWorkitemInterface.ADO else 0)
+
+    def Str_To_Datetime(self, dateString: str) -> datetime:
+        return parse_date(dateString, self.connectionType.name)
 
     def __number_compare(self, num1: int, num2: int):
         if num1 > num2:
@@ -164,23 +239,96 @@ class WorkitemAdapter:
     def Get_Workitem_Response(self, workitemID: str):
         return self.__genericRequest(f"{self.baseWorkitemURL}/{workitemID}")
 
+    def Parse_Workitem_Revision(self, workitemResponse: dict) -> str:
+        if self.connectionType == ExternalWorkitemInterface.ADO:
+            return str(workitemResponse['rev'])
+        elif self.connectionType == ExternalWorkitemInterface.JIRA:
+            return workitemResponse['fields']['updated']
+
     def Get_Workitem_Fields(self, workitemID: str):
         workitemResponse = self.Get_Workitem_Response(workitemID)
         if self.connectionType in [ExternalWorkitemInterface.ADO, ExternalWorkitemInterface.JIRA]:
             return workitemResponse['fields']
 
+    def __get_workitem_batch(self, workitemIDs: list, fields: list = None) -> dict:
+        workitemFieldsDict = {}
+        if self.connectionType == ExternalWorkitemInterface.ADO:
+            batchData = {
+                "ids": [int(workitemID) for workitemID in workitemIDs],
+                "errorPolicy": "omit"
+            }
+            if fields:
+                batchData['fields'] = fields
+            batchResponse = self.__genericPostRequest(f"{self.baseURL}/wit/workitemsbatch?api-version=7.0", batchData)
+            for workitem in batchResponse['value']:
+                if workitem:
+                    workitemFieldsDict[str(workitem['id'])] = workitem['fields']
+
+        elif self.connectionType == ExternalWorkitemInterface.JIRA:
+            for workitem in self.Iterate_Jql_Search(f"key in ({','.join(workitemIDs)})", fields):
+                workitemFieldsDict[workitem['key']] = workitem['fields']
+
+        return workitemFieldsDict
+
+    def __workitem_batches(self, workitemIDs: list) -> list:
+        batchSize = self.adoBatchSize if self.connectionType == ExternalWorkitemInterface.ADO else self.jiraBatchSize
+        return [workitemIDs[i:i + batchSize] for i in range(0, len(workitemIDs), batchSize)]
+
+    def Get_Workitems(self, workitemIDs: list, fields: list = None) -> dict:
+        workitemFieldsDict = {}
+        for batchIDs in self.__workitem_batches(workitemIDs):
+            workitemFieldsDict.update(self.__get_workitem_batch(batchIDs, fields))
+        return workitemFieldsDict
+
+    def Iterate_Workitems(self, workitemIDs: list, fields: list = None):
+        # Requests every batch concurrently and yields (workitemID, fields) as each batch lands, with None fields for IDs the provider did not return
+        with ThreadPoolExecutor(max_workers=self.transport.poolMaxSize) as executor:
+            batchFutures = {executor.submit(self.__get_workitem_batch, batchIDs, fields): batchIDs for batchIDs in self.__workitem_batches(workitemIDs)}
+            try:
+                for batchFuture in as_completed(batchFutures):
+                    workitemFieldsDict = batchFuture.result()
+                    for workitemID in batchFutures[batchFuture]:
+                        yield workitemID, workitemFieldsDict.get(str(workitemID))
+            finally:
+                executor.shutdown(cancel_futures=True)
+
+    def Iterate_Workitems_Field_History(self, workitemIDs: list, field: str, fromDate: datetime = None, toDate: datetime = None, embeddedReturn: list = None):
+        # Yields (workitemID, history) in completion order. A failed work item yields its exception in place of the history.
+        def get_field_history(workitemID: str):
+            try:
+                return self.Get_Workitem_Field_History(workitemID, field, fromDate, toDate, embeddedReturn)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=self.transport.poolMaxSize) as executor:
+            historyFutures = {executor.submit(get_field_history, workitemID): workitemID for workitemID in workitemIDs}
+            try:
+                for historyFuture in as_completed(historyFutures):
+                    yield historyFutures[historyFuture], historyFuture.result()
+            finally:
+                executor.shutdown(cancel_futures=True)
+
     def Get_Workitem_Associations(self, workitemID: str):
+        if self.connectionType == ExternalWorkitemInterface.ADO:
+            associationResponse = self.__genericRequest(f"{self.baseWorkitemURL}/{workitemID}?$expand=relations")
+            return self.Parse_Workitem_Associations(associationResponse)
+
+        elif self.connectionType == ExternalWorkitemInterface.JIRA:
+            workitemResponse = self.Get_Workitem_Response(workitemID)
+            jqlChildrenSearchResponse = self.__jql_search_request(f'"Parent"="{workitemID}"')
+            return self.Parse_Workitem_Associations(workitemResponse, jqlChildrenSearchResponse)
+
+    def Parse_Workitem_Associations(self, workitemResponse: dict, childrenResponse: dict = None):
         returnAssociations = {
             "Parent": None,
             "Children": [],
             "Related": []
         }
         if self.connectionType == ExternalWorkitemInterface.ADO:
-            associationResponse = self.__genericRequest(f"{self.baseWorkitemURL}/{workitemID}?$expand=relations")
-            if 'relations' not in associationResponse:
+            if 'relations' not in workitemResponse:
                 return None
 
-            for association in associationResponse['relations']:
+            for association in workitemResponse['relations']:
                 associationType = association['attributes']['name']
                 associationID = association['url'].split('/')[-1]
 
@@ -192,12 +340,10 @@ class WorkitemAdapter:
                     returnAssociations['Related'].append(associationID)
 
         elif self.connectionType == ExternalWorkitemInterface.JIRA:
-            workitemResponse = self.Get_Workitem_Response(workitemID)
             if 'parent' in workitemResponse['fields']:
                 returnAssociations['Parent'] = workitemResponse['fields']['parent']['key']
 
-            jqlChildrenSearchResponse = self.__jql_search_request(f"%22Parent%22=%22{workitemID}%22")
-            for child in jqlChildrenSearchResponse['issues']:
+            for child in childrenResponse['issues']:
                 returnAssociations['Children'].append(child['key'])
 
             if 'issuelinks' in workitemResponse['fields']:
@@ -213,8 +359,9 @@ class WorkitemAdapter:
         return returnAssociations
 
     def Get_Workitem_Title(self, workitemID: str):
-        workitemFields = self.Get_Workitem_Response(workitemID)['fields']
+        return self.Parse_Workitem_Title(self.Get_Workitem_Fields(workitemID))
 
+    def Parse_Workitem_Title(self, workitemFields: dict):
         if 'System.Title' not in workitemFields and 'summary' not in workitemFields:
             return None
 
@@ -224,8 +371,9 @@ class WorkitemAdapter:
             return workitemFields['summary']
 
     def Get_Workitem_State(self, workitemID: str):
-        workitemFields = self.Get_Workitem_Response(workitemID)['fields']
+        return self.Parse_Workitem_State(self.Get_Workitem_Fields(workitemID))
 
+    def Parse_Workitem_State(self, workitemFields: dict):
         if 'System.State' not in workitemFields and 'status' not in workitemFields:
             return None
 
@@ -235,8 +383,9 @@ class WorkitemAdapter:
             return workitemFields['status']['name']
 
     def Get_Workitem_Description(self, workitemID: str):
-        workitemFields = self.Get_Workitem_Response(workitemID)['fields']
+        return self.Parse_Workitem_Description(self.Get_Workitem_Fields(workitemID))
 
+    def Parse_Workitem_Description(self, workitemFields: dict):
         if 'System.Description' not in workitemFields and 'description' not in workitemFields:
             return None
 
@@ -246,8 +395,9 @@ class WorkitemAdapter:
             return workitemFields['description']
 
     def Get_Workitem_Assignee(self, workitemID: str):
-        workitemFields = self.Get_Workitem_Response(workitemID)['fields']
+        return self.Parse_Workitem_Assignee(self.Get_Workitem_Fields(workitemID))
 
+    def Parse_Workitem_Assignee(self, workitemFields: dict):
         if 'System.AssignedTo' not in workitemFields and 'assignee' not in workitemFields:
             return None
 
@@ -257,8 +407,9 @@ class WorkitemAdapter:
             return workitemFields['assignee']['displayName']
 
     def Get_Workitem_Created_Date(self, workitemID: str):
-        workitemFields = self.Get_Workitem_Response(workitemID)['fields']
+        return self.Parse_Workitem_Created_Date(self.Get_Workitem_Fields(workitemID))
 
+    def Parse_Workitem_Created_Date(self, workitemFields: dict):
         if 'System.CreatedDate' not in workitemFields and 'created' not in workitemFields:
             return None
 
@@ -268,6 +419,14 @@ class WorkitemAdapter:
             return self.Str_To_Datetime(workitemFields['created'])
 
     def Get_Workitem_History(self, workitemID: str):
+        if self.revisionStore:
+            historyList = self.revisionStore.Get_Revisions(self.storeScope, workitemID)
+            if historyList is None:
+                self.__sync_workitem_revisions(workitemID)
+                historyList = self.revisionStore.Get_Revisions(self.storeScope, workitemID)
+            # The store keeps revisions oldest first, which matches ADO updates; Jira's expanded changelog is newest first
+            return historyList if self.connectionType == ExternalWorkitemInterface.ADO else historyList[::-1]
+
         if self.connectionType == ExternalWorkitemInterface.JIRA:
             historyURL = f"{self.baseWorkitemURL}/{workitemID}?expand=changelog"
             historyList = self.__genericRequest(historyURL)['changelog']['histories']
@@ -277,12 +436,60 @@ class WorkitemAdapter:
 
         return historyList
 
+    def __sync_workitem_revisions(self, workitemID: str) -> int:
+        storedCount = self.revisionStore.Get_Revision_Count(self.storeScope, workitemID)
+        newRevisions = []
+        while True:
+            if self.connectionType == ExternalWorkitemInterface.ADO:
+                updatesURL = f"{self.baseWorkitemURL}/{workitemID}/updates?$skip={storedCount + len(newRevisions)}&$top={self.adoUpdatesPageSize}"
+                revisionPage = self.__genericRequest(updatesURL, useCache=False)['value']
+                isLast = len(revisionPage) < self.adoUpdatesPageSize
+            elif self.connectionType == ExternalWorkitemInterface.JIRA:
+                changelogURL = f"{self.baseWorkitemURL}/{workitemID}/changelog?startAt={storedCount + len(newRevisions)}&maxResults={self.jiraChangelogPageSize}"
+                changelogResponse = self.__genericRequest(changelogURL, useCache=False)
+                revisionPage = changelogResponse['values']
+                isLast = changelogResponse.get('isLast', True)
+
+            newRevisions += revisionPage
+            if isLast or len(revisionPage) == 0:
+                break
+
+        self.revisionStore.Append_Revisions(self.storeScope, workitemID, newRevisions)
+        return len(newRevisions)
+
+    def __query_workitem_ids(self, scope) -> list:
+        if self.connectionType == ExternalWorkitemInterface.ADO:
+            return list(self.Iterate_Wiql_Query(scope.Get_Condition_String()))
+        elif self.connectionType == ExternalWorkitemInterface.JIRA:
+            return [workitem['key'] for workitem in self.Iterate_Jql_Search(scope.Get_Condition_String(), fields=['key'])]
+
+    def Sync_Revision_Store(self, scope = None) -> list:
+        from workitemScope import workitemScope # workitemScope imports this module, so it can only be loaded once this one is
+
+        syncStart = datetime.utcnow()
+        highWater = self.revisionStore.Get_High_Water(self.storeScope)
+        syncScope = copy.copy(scope) if scope else workitemScope()
+        syncScope.externalInterface = self.connectionType
+        syncScope.lastUpdated = highWater - self.revisionStore.syncOverlap if highWater else None
+
+        changedWorkitemIDs = self.__query_workitem_ids(syncScope)
+        for workitemID in changedWorkitemIDs:
+            if self.__sync_workitem_revisions(workitemID) > 0:
+                self.Invalidate_Cache(workitemID)
+
+        self.revisionStore.Set_High_Water(self.storeScope, syncStart)
+        return changedWorkitemIDs
+
     def Get_Workitem_Field_History(self, workitemID: str, field: str, fromDate: datetime = None, toDate: datetime = None, embeddedReturn: list = None):
         if field not in self.fieldList:
             raise ValueError(f"Unable to find field: {field}")
 
         workitemFields = self.Get_Workitem_Fields(workitemID)
-        workitemCreatedDate = self.Get_Workitem_Created_Date(workitemID)
+        historyList = self.Get_Workitem_History(workitemID)
+        return self.Parse_Workitem_Field_History(workitemFields, historyList, field, fromDate, toDate, embeddedReturn)
+
+    def Parse_Workitem_Field_History(self, workitemFields: dict, historyList: list, field: str, fromDate: datetime = None, toDate: datetime = None, embeddedReturn: list = None):
+        workitemCreatedDate = self.Parse_Workitem_Created_Date(workitemFields)
         timeNow = datetime.now()
         
         if not fromDate:
@@ -291,10 +498,9 @@ class WorkitemAdapter:
             toDate = timeNow
 
         fieldChanges = []
-        returnArray = []
-        historyList = self.Get_Workitem_History(workitemID)
+        historyDates = self.Parse_Revision_Dates(historyList)
         if self.connectionType == ExternalWorkitemInterface.JIRA:
-            for historyItem in historyList:
+            for historyIndex, historyItem in enumerate(historyList):
                 if 'items' not in historyItem:
                     pass
 
@@ -304,17 +510,16 @@ class WorkitemAdapter:
                     if historyChangeField == field:
                         historyChangeFromString = historyChange['fromString']
                         historyChangeToString = historyChange['toString']
-                        historyDate = self.Str_To_Datetime(historyItem['created'])
 
                         fieldChanges.append({
                             'From': historyChangeFromString,
                             'To': historyChangeToString,
-                            'Date': historyDate})
+                            'Date': historyDates[historyIndex]})
 
             fieldChanges = fieldChanges[::-1]
 
         elif self.connectionType == ExternalWorkitemInterface.ADO:
-            for historyItem in historyList:
+            for historyIndex, historyItem in enumerate(historyList):
                 if 'fields' not in historyItem:
                     continue
 
@@ -344,56 +549,20 @@ class WorkitemAdapter:
                             else:
                                 historyChangeToString = historyItem['fields'][historyChange]['newValue']
 
-                        if 'System.ChangedDate' in historyItem['fields']:
-                            historyDate = self.Str_To_Datetime(historyItem['fields']['System.ChangedDate']['newValue'])
-                        else:
-                            historyDate = self.Str_To_Datetime(historyItem['revisedDate'])
-
                         fieldChanges.append({
                             'From': historyChangeFromString,
                             'To': historyChangeToString,
-                            'Date': historyDate})
+                            'Date': historyDates[historyIndex]})
         
-        dateTimeDelta = (toDate - fromDate)
-        numberOfDays = dateTimeDelta.days + 1
-        if dateTimeDelta.seconds > 0:
-            numberOfDays += 1
-
-        previousVal = None
-        fieldChangIndex = 0
-        if len(fieldChanges) == 0:
-            if field in workitemFields:
-                previousVal = workitemFields[field]
-                if embeddedReturn:
-                    for returnField in embeddedReturn:
-                        previousVal = previousVal[returnField]
-        else:
-            for index, fieldChange in enumerate(fieldChanges):
-                if self.Compare_Dates(fromDate, fieldChange['Date']) in [0, -1]:
-                    fieldChangIndex = index
-                    previousVal = fieldChanges[index]['From']
-                    break
-            if not previousVal: # There is a field change, but it happened before the scope of the report
-                previousVal = fieldChanges[0]['To']
-
-        for i in range(0, numberOfDays):
-            currentDay = fromDate + timedelta(days=i)
-
-            if len(fieldChanges) == 0:
-                returnArray.append((currentDay, previousVal))
-                continue
+        initialValue = None
+        if len(fieldChanges) == 0 and field in workitemFields:
+            initialValue = workitemFields[field]
+            if embeddedReturn:
+                for returnField in embeddedReturn:
+                    initialValue = initialValue[returnField]
 
-            if self.Compare_Dates(fieldChanges[fieldChangIndex]['Date'], currentDay) == 0:
-                while fieldChangIndex + 1 < len(fieldChanges) and self.Compare_Dates(fieldChanges[fieldChangIndex + 1]['Date'], currentDay) == 0:
-                    fieldChangIndex += 1
-                returnArray.append((currentDay, fieldChanges[fieldChangIndex]['To']))
-                previousVal = fieldChanges[fieldChangIndex]['To']
-                if fieldChangIndex + 1 < len(fieldChanges):
-                    fieldChangIndex += 1
-            else:
-                returnArray.append((currentDay, previousVal))
-
-        return returnArray
+        days, values = build_timeline(fieldChanges, fromDate, toDate, initialValue)
+        return list(zip(days.astype(object), values))
 
     def Get_Projects(self):
         if self.connectionType == ExternalWorkitemInterface.ADO:
@@ -406,35 +575,43 @@ class WorkitemAdapter:
             return projectList
 
     def Get_Features(self):
-        featureList = []
-        if self.connectionType == ExternalWorkitemInterface.ADO:
-            queryData = {
-                            "query": "Select [System.Id], [System.Title] FROM workitems WHERE [System.WorkItemType] = 'Feature'"
-                        }
-            featureResponse = self.__genericPostRequest(f"{self.baseURL}/wit/wiql?api-version=7.1-preview.2", queryData)
-            if 'workItems' not in featureResponse:
-                return []
+        return list(self.Iterate_Features())
 
-            for feature in featureResponse['workItems']:
-                featureList.append(str(feature['id']))
+    def Iterate_Features(self):
+        if self.connectionType == ExternalWorkitemInterface.ADO:
+            return self.Iterate_Wiql_Query("[System.WorkItemType] = 'Feature'")
 
         elif self.connectionType == ExternalWorkitemInterface.JIRA:
-            featureResponse = self.__genericRequest(f"{self.baseURL}/latest/search?jql=issuetype=Feature")
-            for feature in featureResponse['issues']:
-                featureList.append(feature['key'])
-
-        return featureList
+            return (feature['key'] for feature in self.Iterate_Jql_Search("issuetype=Feature", fields=['key']))
 
     def Get_Workitem_Sprint(self, workitemID: str):
-        workitemFields = self.Get_Workitem_Fields(workitemID)
+        return self.Parse_Workitem_Sprint(self.Get_Workitem_Fields(workitemID))
+
+    def Parse_Workitem_Sprint(self, workitemFields: dict):
         if self.connectionType == ExternalWorkitemInterface.ADO:
             return workitemFields['System.IterationPath'].split('\\')[-1]
         elif self.connectionType == ExternalWorkitemInterface.JIRA:
-            for field in self.fieldDataList:
-                if field['name'] == 'Sprint':
-                    sprintField = field['id']
-                    break
-            return workitemFields[sprintField][0]['name']
+            return workitemFields[self.fieldRegistry.Get_Field_ID('Sprint')][0]['name']
+
+    def Get_Workitem_Titles(self, workitemIDs: list) -> dict:
+        fields = ['System.Title'] if self.connectionType == ExternalWorkitemInterface.ADO else ['summary']
+        return {workitemID: self.Parse_Workitem_Title(workitemFields) for workitemID, workitemFields in self.Get_Workitems(workitemIDs, fields).items()}
+
+    def Get_Workitem_States(self, workitemIDs: list) -> dict:
+        fields = ['System.State'] if self.connectionType == ExternalWorkitemInterface.ADO else ['status']
+        return {workitemID: self.Parse_Workitem_State(workitemFields) for workitemID, workitemFields in self.Get_Workitems(workitemIDs, fields).items()}
+
+    def Get_Workitem_Assignees(self, workitemIDs: list) -> dict:
+        fields = ['System.AssignedTo'] if self.connectionType == ExternalWorkitemInterface.ADO else ['assignee']
+        return {workitemID: self.Parse_Workitem_Assignee(workitemFields) for workitemID, workitemFields in self.Get_Workitems(workitemIDs, fields).items()}
+
+    def Get_Workitem_Created_Dates(self, workitemIDs: list) -> dict:
+        fields = ['System.CreatedDate'] if self.connectionType == ExternalWorkitemInterface.ADO else ['created']
+        return {workitemID: self.Parse_Workitem_Created_Date(workitemFields) for workitemID, workitemFields in self.Get_Workitems(workitemIDs, fields).items()}
+
+    def Get_Workitem_Sprints(self, workitemIDs: list) -> dict:
+        fields = ['System.IterationPath'] if self.connectionType == ExternalWorkitemInterface.ADO else None
+        return {workitemID: self.Parse_Workitem_Sprint(workitemFields) for workitemID, workitemFields in self.Get_Workitems(workitemIDs, fields).items()}
 
     def Get_Sprints(self, inputScope: str):
         sprintDict = {}
@@ -477,84 +654,111 @@ class WorkitemAdapter:
     def Get_Employees(self):
         returnList = []
         if self.connectionType == ExternalWorkitemInterface.JIRA:
-            url = f"{self.baseURL}/2/users/search"
-            for user in self.__genericRequest(url):
+            for user in self.Iterate_Employees():
                 if 'displayName' in user and 'emailAddress' in user and user['active']:
                     returnList.append((user['displayName'], user['emailAddress']))
 
         elif self.connectionType == ExternalWorkitemInterface.ADO:
-            url = f"https://vssps.dev.azure.com/{self.organization}/_apis/graph/users?api-version=7.0-preview.1" #TODO Currently works in Chrome and not in requests
-            for user in self.__genericRequest(url)['value']:
+            for user in self.Iterate_Employees():
                 if 'displayName' in user and 'mailAddress' in user and user['domain'] not in ['Build']:
                     returnList.append((user['displayName'], user['mailAddress']))
                 
         return returnList
 
     def Is_Workitem_ChangedBy(self, workitemID: str, employee: str, fromDate: datetime = None, toDate: datetime = None) -> bool:
-        employee = employee.strip()
-        returnList = []
+        workitemHistory = self.Get_Workitem_History(workitemID)
+        return self.Parse_Workitem_ChangedBy(workitemHistory, employee, fromDate, toDate)
+
+    def __employee_identifier_type(self, employee: str) -> str:
         if ' ' in employee:
-            employeeIdentifierType = "Name"
+            return "Name"
         elif '@' in employee:
-            employeeIdentifierType = "Email"
+            return "Email"
         else:
             raise ValueError(f"{employee} must either be a name (contain a ' ') or be an email (contain an @)")
 
+    def Parse_Revision_Dates(self, historyList: list) -> np.ndarray:
+        if self.connectionType == ExternalWorkitemInterface.ADO:
+            dateStrings = [
+                historyItem['fields']['System.ChangedDate']['newValue'] if 'fields' in historyItem and 'System.ChangedDate' in historyItem['fields'] else historyItem['revisedDate']
+                for historyItem in historyList
+            ]
+        elif self.connectionType == ExternalWorkitemInterface.JIRA:
+            dateStrings = [historyItem['created'] for historyItem in historyList]
+        return parse_many(dateStrings, self.connectionType.name)
+
+    def Parse_Workitem_ChangedBy(self, workitemHistory: list, employee: str, fromDate: datetime = None, toDate: datetime = None) -> list:
+        employee = employee.strip()
+        returnList = []
+        employeeIdentifierType = self.__employee_identifier_type(employee)
+
         fromDate = datetime(year=1999, month=1, day=1) if not fromDate else fromDate
         toDate = datetime.now() if not toDate else toDate
 
-        workitemHistory = self.Get_Workitem_History(workitemID)
+        historyDates = self.Parse_Revision_Dates(workitemHistory)
+        inRange = (historyDates > np.datetime64(fromDate)) & (historyDates < np.datetime64(toDate))
+        identityKey = "displayName" if employeeIdentifierType == "Name" else ("uniqueName" if self.connectionType == ExternalWorkitemInterface.ADO else "emailAddress")
+        authorKey = "revisedBy" if self.connectionType == ExternalWorkitemInterface.ADO else "author"
 
-        if self.connectionType == ExternalWorkitemInterface.ADO:
-            for historyPoint in workitemHistory:
-                historyPointName = historyPoint['revisedBy']['displayName'].lower()
-                historyPointEmail = historyPoint['revisedBy']['uniqueName'].lower()
-                historyPointDate = historyPoint['fields']['System.ChangedDate']['newValue'] if 'fields' in historyPoint and 'System.ChangedDate' in historyPoint['fields'] else historyPoint['revisedDate']
-                historyPointDate = self.Str_To_Datetime(historyPointDate)
+        for historyPoint, historyPointDate, keep in zip(workitemHistory, historyDates.astype(object), inRange):
+            if keep and employee.lower() == historyPoint[authorKey][identityKey].lower():
+                returnList.append(historyPointDate)
 
-                if historyPointDate > fromDate and historyPointDate < toDate and\
-                        ((employeeIdentifierType == "Name" and employee.lower() == historyPointName) or\
-                        (employeeIdentifierType == "Email" and employee.lower() == historyPointEmail)):
-                    returnList.append(historyPointDate)
+        return returnList
 
-        elif self.connectionType == ExternalWorkitemInterface.JIRA:
-            for historyPoint in workitemHistory:
-                historyPointName = historyPoint['author']['displayName'].lower()
-                historyPointEmail = historyPoint['author']['emailAddress'].lower()
-                historyPointDate = historyPoint['created']
-                historyPointDate = self.Str_To_Datetime(historyPointDate)
-                
-                if historyPointDate > fromDate and historyPointDate < toDate and\
-                        ((employeeIdentifierType == "Name" and employee.lower() == historyPointName) or\
-                        (employeeIdentifierType == "Email" and employee.lower() == historyPointEmail)):
-                    returnList.append(historyPointDate)
+    def Iterate_Contribution_Candidates(self, employee: str, fromDate: datetime = None, toDate: datetime = None):
+        # Narrows the scan to items the employee ever changed, last changed inside the window; histories still decide the exact dates
+        employee = employee.strip()
+        self.__employee_identifier_type(employee)
 
-        return returnList
+        if self.connectionType == ExternalWorkitemInterface.ADO:
+            wiqlEmployee = employee.replace("'", "''")
+            conditions = [
+                "[System.WorkItemType] IN ('User Story','Bug','Issue')",
+                f"[System.ChangedBy] EVER '{wiqlEmployee}'"
+            ]
+            if fromDate:
+                conditions.append(f"[System.ChangedDate] >= '{fromDate.strftime('%Y-%m-%dT%H:%M:%SZ')}'")
+            return self.Iterate_Wiql_Query(" AND ".join(conditions))
+
+        elif self.connectionType == ExternalWorkitemInterface.JIRA:
+            jiraEmployee = employee.replace('"', '\\"')
+            conditions = ["issuetype in (Story,Subtask)"]
+            if fromDate or toDate:
+                jiraFromDate = fromDate.strftime("%Y/%m/%d %H:%M") if fromDate else "1999/01/01 00:00"
+                jiraToDate = toDate.strftime("%Y/%m/%d %H:%M") if toDate else datetime.now().strftime("%Y/%m/%d %H:%M")
+                conditions.append(f'issuekey in updatedBy("{jiraEmployee}", "{jiraFromDate}", "{jiraToDate}")')
+            else:
+                conditions.append(f'issuekey in updatedBy("{jiraEmployee}")')
+            if fromDate:
+                conditions.append(f'updated >= "{fromDate.strftime("%Y/%m/%d %H:%M")}"')
+            return (workitem['id'] for workitem in self.Iterate_Jql_Search(" AND ".join(conditions), fields=['key']))
 
     def Get_Employee_Contributions(self, employee: str, fromDate: datetime = None, toDate: datetime = None) -> list:
         totalChangeList = []
-        if self.connectionType == ExternalWorkitemInterface.ADO:
-            queryData = {
-                            "query": "Select [System.Id], [System.Title] FROM workitems WHERE [System.WorkItemType] IN ('User Story','Bug','Issue')"
-                        }
-            workitemResponse = self.__genericPostRequest(f"{self.baseURL}/wit/wiql?api-version=7.1-preview.2", queryData) # TODO Test ADO part of this function
-            if 'workItems' not in workitemResponse:
-                return []
+        workitemIDs = self.Iterate_Contribution_Candidates(employee, fromDate, toDate)
 
-            for workitem in workitemResponse['workItems']:
-                changeList = self.Is_Workitem_ChangedBy(workitemID=workitem['id'], employee=employee, fromDate=fromDate, toDate=toDate)
+        with ThreadPoolExecutor(max_workers=self.transport.poolMaxSize) as executor:
+            changeLists = executor.map(lambda workitemID: (workitemID, self.Is_Workitem_ChangedBy(workitemID=workitemID, employee=employee, fromDate=fromDate, toDate=toDate)), workitemIDs)
+            for workitemID, changeList in changeLists:
                 for changeDate in changeList:
-                    totalChangeList.append((workitem['id'], changeDate))
-
-        elif self.connectionType == ExternalWorkitemInterface.JIRA:
-            workitemResponse = self.__genericRequest(f"{self.baseURL}/latest/search?jql=issuetype in (Story,Subtask)")
-            for workitem in workitemResponse['issues']:
-                changeList = self.Is_Workitem_ChangedBy(workitemID=workitem['id'], employee=employee, fromDate=fromDate, toDate=toDate)
-                for changeDate in changeList:
-                    totalChangeList.append((workitem['id'], changeDate))
+                    totalChangeList.append((workitemID, changeDate))
 
         return totalChangeList
 
+serviceCache = ResponseCache()
+serviceSingleFlight = SingleFlight()
+servicePool = AdapterPool()
+
+@app.errorhandler(UpstreamRequestError)
+def handle_upstream_error(error: UpstreamRequestError):
+    # Client errors from the provider pass through as is, anything else is reported as a bad gateway
+    statusCode = error.statusCode if error.statusCode and error.statusCode < 500 else 502
+    return({
+        "Message": str(error),
+        "Status": statusCode
+    }, statusCode)
+
 def initialize(request) -> WorkitemAdapter:
     requestData = request.data
     if not len(requestData) == 0:
@@ -562,12 +766,17 @@ def initialize(request) -> WorkitemAdapter:
     else:
         requestData = request.form
     try:
-        adapter = WorkitemAdapter(
-            ExternalWorkitemInterface.ADO,
-            requestData['username'],
-            requestData['pat'],
-            requestData['org'],
-            requestData['project']
+        adapter = servicePool.Get_Adapter(
+            lambda: WorkitemAdapter(
+                ExternalWorkitemInterface.ADO,
+                requestData['username'],
+                requestData['pat'],
+                requestData['org'],
+                requestData['project'],
+                cache=serviceCache,
+                singleFlight=serviceSingleFlight
+            ),
+            ExternalWorkitemInterface.ADO.name, requestData['org'], requestData['project'], requestData['username'], requestData['pat']
         )
     except:
         adapter = None
@@ -603,8 +812,16 @@ def route_workitemResponse(workitemId):
     if not thisWorkitemAdapter:
         return(badRequestReturn)
 
-    return({
-        "Value": thisWorkitemAdapter.Get_Workitem_Response(workitemID=workitemId),
+    workitemResponse = thisWorkitemAdapter.Get_Workitem_Response(workitemID=workitemId)
+    if workitemResponse is None:
+        return({
+            "Value": None,
+            "Status": 200
+        })
+
+    etag = strong_etag(thisWorkitemAdapter.storeScope, workitemId, thisWorkitemAdapter.Parse_Workitem_Revision(workitemResponse))
+    return conditional_response(request, etag, lambda: {
+        "Value": workitemResponse,
         "Status": 200
     })
 
@@ -691,7 +908,16 @@ def route_workitemHistory(workitemId):
     if not thisWorkitemAdapter:
         return(badRequestReturn)
 
-    return({
+    # The history only changes along with the work item revision, so a matching tag skips fetching the history at all
+    workitemResponse = thisWorkitemAdapter.Get_Workitem_Response(workitemID=workitemId)
+    if workitemResponse is None:
+        return({
+            "Value": thisWorkitemAdapter.Get_Workitem_History(workitemID=workitemId),
+            "Status": 200
+        })
+
+    etag = strong_etag(thisWorkitemAdapter.storeScope, workitemId, "history", thisWorkitemAdapter.Parse_Workitem_Revision(workitemResponse))
+    return conditional_response(request, etag, lambda: {
         "Value": thisWorkitemAdapter.Get_Workitem_History(workitemID=workitemId),
         "Status": 200
     })
@@ -722,6 +948,58 @@ def route_workitemFeieldHistory(workitemId, field):
         "Status": 200
     })
 
+def ndjson_line(value) -> str:
+    return json.dumps(value, default=lambda item: item.isoformat() if isinstance(item, datetime) else str(item)) + "\n"
+
+def batch_request_data(request) -> dict:
+    requestData = request.data
+    if not len(requestData) == 0:
+        return json.loads(request.data.decode())
+    return request.form
+
+@app.route("/workitems:batch", methods=['POST'])
+def route_workitemsBatch():
+    thisWorkitemAdapter = initialize(request)
+    if not thisWorkitemAdapter:
+        return(badRequestReturn)
+
+    requestData = batch_request_data(request)
+    workitemIDs = [str(workitemID) for workitemID in requestData['ids']]
+    fields = requestData.get('fields')
+
+    def generate():
+        for workitemID, workitemFields in thisWorkitemAdapter.Iterate_Workitems(workitemIDs, fields):
+            if workitemFields is None:
+                yield ndjson_line({"ID": workitemID, "Message": "Work item not found", "Status": 404})
+            else:
+                yield ndjson_line({"ID": workitemID, "Fields": workitemFields, "Status": 200})
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+@app.route("/workitems/history:batch", methods=['POST'])
+def route_workitemsHistoryBatch():
+    thisWorkitemAdapter = initialize(request)
+    if not thisWorkitemAdapter:
+        return(badRequestReturn)
+
+    requestData = batch_request_data(request)
+    workitemIDs = [str(workitemID) for workitemID in requestData['ids']]
+    fromDate = parse_date(requestData['fromDate']) if requestData.get('fromDate') else None
+    toDate = parse_date(requestData['toDate']) if requestData.get('toDate') else None
+
+    def generate():
+        for workitemID, fieldHistory in thisWorkitemAdapter.Iterate_Workitems_Field_History(
+            workitemIDs, requestData['field'], fromDate, toDate, requestData.get('embeddedReturn')
+        ):
+            if isinstance(fieldHistory, Exception):
+                yield ndjson_line({"ID": workitemID, "Message": str(fieldHistory), "Status": 500})
+                continue
+
+            dateList, fieldList = zip(*fieldHistory) if fieldHistory else ((), ())
+            yield ndjson_line({"ID": workitemID, "Dates": dateList, "Values": fieldList, "Status": 200})
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
 @app.route("/workitem/<string:workitemId>/changedBy/<string:employee>", methods=['GET'])
 def route_workitemFeildHistory(workitemId, employee):
     thisWorkitemAdapter = initialize(request)
@@ -18,11 +18,17 @@ class workitemScope:
         self.externalInterface = externalInterface
 
     def Get_Query_String(self):
+        conditionString = self.Get_Condition_String()
+        if self.externalInterface == ExternalWorkitemInterface.ADO:
+            return f"SELECT [System.Id] FROM workitems WHERE {conditionString}" if conditionString else "SELECT [System.Id] FROM workitems"
+        elif self.externalInterface == ExternalWorkitemInterface.JIRA:
+            return conditionString
+
+    def Get_Condition_String(self):
         if self.externalInterface == ExternalWorkitemInterface.ADO:
-            returnString = "SELECT [System.Id] FROM workitems WHERE "
             whereConditions = []
             if self.project:
-                whereConditions.append(f"[System.TeamProject] = {self.project}")
+                whereConditions.append(f"[System.TeamProject] = '{self.project}'")
             if self.assigneeList:
                 assigneeCondition = ""
                 for assignee in self.assigneeList:
@@ -36,13 +42,13 @@ class workitemScope:
                 typeCondition = typeCondition[:-1]
                 whereConditions.append(f"[System.WorkItemType] IN ({typeCondition})")
             if self.lastUpdated:
-                whereConditions.append(f"[System.ChangedDate] > {self.lastUpdated}")
+                whereConditions.append(f"[System.ChangedDate] > '{self.lastUpdated.strftime('%Y-%m-%dT%H:%M:%SZ')}'")
             if self.stateList:
                 stateCondition = ""
                 for state in self.stateList:
                     stateCondition += f"'{state}',"
                 stateCondition = stateCondition[:-1]
-                whereConditions.append(f"[System.State] IN ({self.project})")
+                whereConditions.append(f"[System.State] IN ({stateCondition})")
             if self.titleContains:
                 whereConditions.append(f"[System.Title] CONTAINS '{self.titleContains}'")
             if self.iterationPathUnder:
@@ -50,12 +56,26 @@ class workitemScope:
             if self.areaPathUnder:
                 whereConditions.append(f"[System.AreaPath] UNDER {self.areaPathUnder}")
 
-            for condition in whereConditions:
-                returnString += f"{condition} AND"
-            returnString = returnString[:-4]
-
+            returnString = " AND ".join(whereConditions)
 
         elif self.externalInterface == ExternalWorkitemInterface.JIRA:
-            returnString = ""
+            whereConditions = []
+            if self.project:
+                whereConditions.append(f'project = "{self.project}"')
+            if self.assigneeList:
+                assigneeCondition = ",".join(f'"{assignee}"' for assignee in self.assigneeList)
+                whereConditions.append(f"assignee IN ({assigneeCondition})")
+            if self.workitemTypeList:
+                typeCondition = ",".join(f'"{workitemType}"' for workitemType in self.workitemTypeList)
+                whereConditions.append(f"issuetype IN ({typeCondition})")
+            if self.lastUpdated:
+                whereConditions.append(f'updated >= "{self.lastUpdated.strftime("%Y/%m/%d %H:%M")}"')
+            if self.stateList:
+                stateCondition = ",".join(f'"{state}"' for state in self.stateList)
+                whereConditions.append(f"status IN ({stateCondition})")
+            if self.titleContains:
+                whereConditions.append(f'summary ~ "{self.titleContains}"')
+
+            returnString = " AND ".join(whereConditions)
 
         return returnString
\ No newline at end of file
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modules under src import one another by bare name (as they do when run from src), so expose src on the path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
@@ -1,2 +1,14 @@
 %1\python -m unittest tests\test_workitemAdapter.py
-%1\python -m unittest tests\test_repoAdapter.py  
\ No newline at end of file
+%1\python -m unittest tests\test_repoAdapter.py  
+%1\python -m unittest tests\test_httpTransport.py
+%1\python -m unittest tests\test_asyncWorkitemAdapter.py
+%1\python -m unittest tests\test_responseCache.py
+%1\python -m unittest tests\test_revisionStore.py
+%1\python -m unittest tests\test_pagination.py
+%1\python -m unittest tests\test_timelineEngine.py
+%1\python -m unittest tests\test_dateParsing.py
+%1\python -m unittest tests\test_fieldRegistry.py
+%1\python -m unittest tests\test_adapterPool.py
+%1\python -m unittest tests\test_workitemService.py
+%1\python -m unittest tests\test_repoService.py
+%1\python -m unittest tests\test_singleFlight.py
\ No newline at end of file
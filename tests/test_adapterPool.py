@@ -0,0 +1,97 @@
+import unittest
+import json
+import sys
+import threading
+import time
+from unittest.mock import patch
+sys.path.append('..')
+import workitemAdapter
+from adapterPool import AdapterPool
+
+class MockResponse:
+    def __init__(self, json_data, status_code, headers: dict = None):
+        self.json_data = json_data
+        self.status_code = status_code
+        self.headers = headers if headers else {}
+        self.content = json.dumps(json_data).encode()
+
+    def json(self):
+        return self.json_data
+
+class TestAdapterPool(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.adapterPool = AdapterPool(maxSize=2, idleSeconds=60)
+        self.createCount = 0
+
+    def create_adapter(self):
+        self.createCount += 1
+        return object()
+
+    def test_Get_Adapter_Reuses_Warm_Adapter(self):
+        first = self.adapterPool.Get_Adapter(self.create_adapter, "ADO", "org", "project", "user", "pat")
+        second = self.adapterPool.Get_Adapter(self.create_adapter, "ADO", "org", "project", "user", "pat")
+        self.assertIs(first, second)
+        self.assertEqual(self.createCount, 1)
+        self.assertEqual(self.adapterPool.Get_Stats()["Hits"], 1)
+
+    def test_Credentials_Separate_Adapters(self):
+        first = self.adapterPool.Get_Adapter(self.create_adapter, "ADO", "org", "project", "user", "pat")
+        second = self.adapterPool.Get_Adapter(self.create_adapter, "ADO", "org", "project", "user", "other pat")
+        self.assertIsNot(first, second)
+        self.assertNotIn("pat", "".join(self.adapterPool.adapters))
+
+    def test_Idle_Eviction(self):
+        first = self.adapterPool.Get_Adapter(self.create_adapter, "ADO", "org", "project", "user", "pat")
+        with patch('adapterPool.time.monotonic', return_value=time.monotonic() + 61):
+            second = self.adapterPool.Get_Adapter(self.create_adapter, "ADO", "org", "project", "user", "pat")
+        self.assertIsNot(first, second)
+        self.assertEqual(self.adapterPool.Get_Stats()["Evictions"], 1)
+
+    def test_Max_Size(self):
+        for project in ["one", "two", "three"]:
+            self.adapterPool.Get_Adapter(self.create_adapter, "ADO", "org", project, "user", "pat")
+        self.assertEqual(self.adapterPool.Get_Stats()["Adapters"], 2)
+        self.adapterPool.Get_Adapter(self.create_adapter, "ADO", "org", "one", "user", "pat")
+        self.assertEqual(self.createCount, 4)
+
+    def test_Failed_Creation_Not_Pooled(self):
+        def failing_adapter():
+            raise ValueError("Unable to authenticate")
+
+        with self.assertRaises(ValueError):
+            self.adapterPool.Get_Adapter(failing_adapter, "ADO", "org", "project", "user", "bad pat")
+        self.assertEqual(self.adapterPool.Get_Stats()["Adapters"], 0)
+        self.assertEqual(len(self.adapterPool.creationLocks), 0)
+
+    def test_Concurrent_Misses_Create_Once(self):
+        def slow_adapter():
+            time.sleep(0.05)
+            return self.create_adapter()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.adapterPool.Get_Adapter(slow_adapter, "ADO", "org", "project", "user", "pat")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.createCount, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_Service_Routes_Share_Adapter(self):
+        workitemAdapter.servicePool.Clear()
+        client = workitemAdapter.app.test_client()
+        requestData = {"username": "user", "pat": "pat", "org": "pool-org", "project": "pool-project"}
+        with patch('requests.Session.get') as mock_get:
+            mock_get.return_value = MockResponse({"value": [{"referenceName": "System.State", "name": "State"}]}, 200)
+            missesBefore = workitemAdapter.servicePool.Get_Stats()["Misses"]
+            for _ in range(3):
+                self.assertEqual(client.get("/init", json=requestData).get_json()["Status"], 200)
+            self.assertEqual(workitemAdapter.servicePool.Get_Stats()["Misses"] - missesBefore, 1)
+        workitemAdapter.servicePool.Clear()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import asyncio
+import json
+import sys
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+sys.path.append('..')
+from workitemAdapter import ExternalWorkitemInterface, WorkitemAdapter
+from asyncWorkitemAdapter import AsyncWorkitemAdapter
+
+class MockResponse:
+    def __init__(self, json_data, status_code, headers: dict = None):
+        self.json_data = json_data
+        self.status_code = status_code
+        self.headers = headers if headers else {}
+        self.content = json.dumps(json_data).encode()
+
+    def json(self):
+        return self.json_data
+
+class ConcurrencyTrackingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    inFlight = 0
+    maxInFlight = 0
+    childCount = 6
+
+    def do_GET(self):
+        with self.lock:
+            ConcurrencyTrackingHandler.inFlight += 1
+            ConcurrencyTrackingHandler.maxInFlight = max(ConcurrencyTrackingHandler.maxInFlight, ConcurrencyTrackingHandler.inFlight)
+        time.sleep(0.1)
+
+        workitemID = self.path.split('?')[0].split('/')[2]
+        if 'expand=relations' in self.path:
+            payload = {"relations": [
+                {"attributes": {"name": "Child"}, "url": f"https://dev.azure.com/org/_apis/wit/workItems/{childID}"}
+                for childID in range(100, 100 + self.childCount)
+            ]}
+        elif self.path.endswith('/updates'):
+            payload = {"value": [
+                {"fields": {"System.State": {"newValue": "New"}, "System.ChangedDate": {"newValue": "2022-12-01T10:00:00Z"}}},
+                {"fields": {"System.State": {"oldValue": "New", "newValue": "Done"}, "System.ChangedDate": {"newValue": "2022-12-03T10:00:00Z"}}}
+            ]}
+        else:
+            payload = {"id": workitemID, "fields": {"System.Title": f"Item {workitemID}", "System.State": "Done", "System.CreatedDate": "2022-12-01T10:00:00Z"}}
+
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with self.lock:
+            ConcurrencyTrackingHandler.inFlight -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+class TestAsyncWorkitemAdapter(unittest.TestCase):
+
+    def setUp(self) -> None:
+        ConcurrencyTrackingHandler.maxInFlight = 0
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), ConcurrencyTrackingHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        with patch('requests.Session.get') as mock_get:
+            mock_get.return_value = MockResponse({"value": [{"referenceName": "System.State"}]}, 200)
+            self.workitemAdapter = WorkitemAdapter(ExternalWorkitemInterface.ADO, None, "pat", "org", "project")
+        self.workitemAdapter.baseWorkitemURL = f"http://127.0.0.1:{self.server.server_address[1]}/workitems"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    async def gather_children(self, maxConcurrency: int):
+        async with AsyncWorkitemAdapter(self.workitemAdapter, maxConcurrency=maxConcurrency) as asyncWorkitemAdapter:
+            return await asyncWorkitemAdapter.Get_Children_Field_History('1', "System.State",
+                fromDate=datetime(year=2022, month=12, day=1), toDate=datetime(year=2022, month=12, day=4))
+
+    def test_Get_Children_Field_History(self):
+        response = asyncio.run(self.gather_children(maxConcurrency=4))
+        self.assertEqual(list(response.keys()), [str(childID) for childID in range(100, 106)])
+        for childHistory in response.values():
+            self.assertEqual([state for _, state in childHistory], ["New", "New", "Done", "Done"])
+
+    def test_Bounded_Concurrency(self):
+        asyncio.run(self.gather_children(maxConcurrency=4))
+        self.assertGreater(ConcurrencyTrackingHandler.maxInFlight, 1)
+        self.assertLessEqual(ConcurrencyTrackingHandler.maxInFlight, 4)
+
+    def test_Get_Workitem_Title(self):
+        async def get_title():
+            async with AsyncWorkitemAdapter(self.workitemAdapter) as asyncWorkitemAdapter:
+                return await asyncWorkitemAdapter.Get_Workitem_Title('7')
+        self.assertEqual(asyncio.run(get_title()), "Item 7")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import sys
+import numpy as np
+from datetime import datetime
+sys.path.append('..')
+import dateParsing
+from dateParsing import parse_date, parse_many
+
+class TestDateParsing(unittest.TestCase):
+
+    def setUp(self):
+        dateParsing.sourceFormats.clear()
+
+    def test_Parse_Date_ISO(self):
+        self.assertEqual(parse_date("2022-01-02"), datetime(2022, 1, 2))
+        self.assertEqual(parse_date("2022-01-02T01:30:54"), datetime(2022, 1, 2, 1, 30, 54))
+        self.assertEqual(parse_date("2022-01-02 01:30:54"), datetime(2022, 1, 2, 1, 30, 54))
+        self.assertEqual(parse_date("2022-01-02T01:30:54Z"), datetime(2022, 1, 2, 1, 30, 54))
+        self.assertEqual(parse_date("2022-01-02T01:30:54.487Z"), datetime(2022, 1, 2, 1, 30, 54))
+        # Offsets are dropped rather than converted, as the adapters have always done
+        self.assertEqual(parse_date("2022-01-02T01:30:54+05:00"), datetime(2022, 1, 2, 1, 30, 54))
+        self.assertEqual(parse_date("2022-01-02T01:30:54.000-0500"), datetime(2022, 1, 2, 1, 30, 54))
+
+    def test_Parse_Date_Formatted(self):
+        self.assertEqual(parse_date("01/01/2022"), datetime(2022, 1, 1))
+        self.assertEqual(parse_date("01/01/2022 12:45:20"), datetime(2022, 1, 1, 12, 45, 20))
+        self.assertEqual(parse_date("01/01/2022T01:30:54"), datetime(2022, 1, 1, 1, 30, 54))
+        self.assertEqual(parse_date("2022-1-2"), datetime(2022, 1, 2))
+
+    def test_Parse_Date_Invalid(self):
+        for dateString in ["01-01-2022", "2022-13-01", "*1-mm-2022", "2022-01-02 12:45", "2022-01-02 12:45:20abc", ""]:
+            with self.assertRaises(ValueError):
+                parse_date(dateString)
+
+    def test_Source_Format_Cache(self):
+        self.assertEqual(parse_date("01/01/2022 12:45:20", "Source"), datetime(2022, 1, 1, 12, 45, 20))
+        self.assertEqual(dateParsing.sourceFormats["Source"], "%m/%d/%Y %H:%M:%S")
+
+        # A source that changes format is sniffed again
+        self.assertEqual(parse_date("2022-01-02T01:30:54Z", "Source"), datetime(2022, 1, 2, 1, 30, 54))
+        self.assertEqual(dateParsing.sourceFormats["Source"], dateParsing.isoFormat)
+
+    def test_Parse_Many(self):
+        result = parse_many(["2022-01-02T01:30:54.487Z", "2022-01-03", "2022-01-04T10:00:00+05:00"])
+        self.assertEqual(result.dtype, np.dtype('datetime64[s]'))
+        self.assertEqual(list(result.astype(object)), [datetime(2022, 1, 2, 1, 30, 54), datetime(2022, 1, 3), datetime(2022, 1, 4, 10)])
+
+    def test_Parse_Many_Fallback(self):
+        result = parse_many(["2022-01-02T01:30:54Z", "01/05/2022 08:00:00"])
+        self.assertEqual(list(result.astype(object)), [datetime(2022, 1, 2, 1, 30, 54), datetime(2022, 1, 5, 8)])
+
+        with self.assertRaises(ValueError):
+            parse_many(["2022-01-02", "not a date"])
+
+    def test_Parse_Many_Empty(self):
+        self.assertEqual(len(parse_many([])), 0)
+
+if __name__ == "__main__":
+    unittest.main()
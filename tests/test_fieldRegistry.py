@@ -0,0 +1,95 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+sys.path.append('..')
+from workitemAdapter import ExternalWorkitemInterface, WorkitemAdapter
+from fieldRegistry import FieldRegistry, FieldRegistryCache
+
+class MockResponse:
+    def __init__(self, json_data, status_code, headers: dict = None):
+        self.json_data = json_data
+        self.status_code = status_code
+        self.headers = headers if headers else {}
+        self.content = json.dumps(json_data).encode()
+
+    def json(self):
+        return self.json_data
+
+jiraFields = [
+    {"key": "status", "id": "status", "name": "Status"},
+    {"key": "customfield_10020", "id": "customfield_10020", "name": "Sprint"},
+    {"key": "customfield_10021", "id": "customfield_10021", "name": "Sprint"}
+]
+
+class TestFieldRegistry(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tempDirectory = tempfile.TemporaryDirectory()
+        self.fieldRegistries = FieldRegistryCache(self.tempDirectory.name, ttlSeconds=60, maxScopes=2)
+        self.loadCount = 0
+
+    def tearDown(self) -> None:
+        self.tempDirectory.cleanup()
+
+    def load_fields(self):
+        self.loadCount += 1
+        return jiraFields
+
+    def test_Registry_Indexes(self):
+        registry = FieldRegistry(jiraFields, 'key', 'id')
+        self.assertIn("status", registry)
+        self.assertNotIn("Status", registry)
+        self.assertEqual(registry.Get_Field("Status")['key'], "status")
+        self.assertEqual(registry.Get_Field("customfield_10021")['name'], "Sprint")
+        self.assertEqual(registry.Get_Field_ID("Sprint"), "customfield_10020")
+        self.assertIsNone(registry.Get_Field("missing"))
+
+    def test_Registry_Shared_In_Memory(self):
+        first = self.fieldRegistries.Get_Registry("JIRA:org:None", self.load_fields, 'key', 'id')
+        second = self.fieldRegistries.Get_Registry("JIRA:org:None", self.load_fields, 'key', 'id')
+        self.assertIs(first, second)
+        self.assertEqual(self.loadCount, 1)
+
+    def test_Registry_Loaded_From_Disk(self):
+        self.fieldRegistries.Get_Registry("JIRA:org:None", self.load_fields, 'key', 'id')
+        restartedRegistries = FieldRegistryCache(self.tempDirectory.name, ttlSeconds=60)
+        registry = restartedRegistries.Get_Registry("JIRA:org:None", self.load_fields, 'key', 'id')
+        self.assertEqual(self.loadCount, 1)
+        self.assertEqual(registry.Get_Field_ID("Sprint"), "customfield_10020")
+
+    def test_Registry_Expires(self):
+        self.fieldRegistries.Get_Registry("JIRA:org:None", self.load_fields, 'key', 'id')
+        with patch('fieldRegistry.time.time', return_value=time.time() + 61):
+            self.fieldRegistries.Get_Registry("JIRA:org:None", self.load_fields, 'key', 'id')
+        self.assertEqual(self.loadCount, 2)
+
+    def test_Registry_Scopes_Bounded(self):
+        for organization in ["one", "two", "three"]:
+            self.fieldRegistries.Get_Registry(f"JIRA:{organization}:None", self.load_fields, 'key', 'id')
+        self.assertEqual(len(self.fieldRegistries.registries), 2)
+        self.assertNotIn("JIRA:one:None", self.fieldRegistries.registries)
+
+    def test_Invalidate(self):
+        self.fieldRegistries.Get_Registry("JIRA:org:None", self.load_fields, 'key', 'id')
+        self.fieldRegistries.Invalidate("JIRA:org:None")
+        self.fieldRegistries.Get_Registry("JIRA:org:None", self.load_fields, 'key', 'id')
+        self.assertEqual(self.loadCount, 2)
+
+    def test_Adapters_Share_Registry(self):
+        with patch('requests.Session.get') as mock_get:
+            mock_get.return_value = MockResponse(jiraFields, 200)
+            adapters = [
+                WorkitemAdapter(ExternalWorkitemInterface.JIRA, "user", "pat", "org", fieldRegistries=self.fieldRegistries) for _ in range(5)
+            ]
+            self.assertEqual(mock_get.call_count, 1)
+
+        self.assertIs(adapters[0].fieldRegistry, adapters[4].fieldRegistry)
+        self.assertEqual(len(adapters[4].fieldList), 3)
+        self.assertEqual(adapters[4].Parse_Workitem_Sprint({"customfield_10020": [{"name": "Sprint 4"}]}), "Sprint 4")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.append('..')
+from httpTransport import HttpTransport
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"value": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestHttpTransport(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+        self.serverThread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.serverThread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/wit/fields"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_Connection_Reuse(self):
+        transport = HttpTransport()
+        for _ in range(0, 5):
+            response = transport.Get(self.url)
+            self.assertEqual(response.json(), {"value": []})
+
+        stats = transport.Get_Pool_Stats()
+        self.assertEqual(stats['Requests'], 5)
+        self.assertEqual(stats['Connections Opened'], 1)
+        self.assertEqual(stats['Handshakes Saved'], 4)
+        transport.Close()
+
+    def test_Gzip_Negotiation(self):
+        transport = HttpTransport()
+        self.assertIn('gzip', transport.session.headers['Accept-Encoding'])
+        transport.Close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+import sys
+import threading
+sys.path.append('..')
+from pagination import prefetch_pages
+
+class TestPagination(unittest.TestCase):
+
+    def test_Prefetch_Pages_Order(self):
+        pages = {0: ([1, 2], 2), 2: ([3, 4], 4), 4: ([5], None)}
+        self.assertEqual(list(prefetch_pages(lambda cursor: pages[cursor], 0)), [1, 2, 3, 4, 5])
+
+    def test_Prefetch_One_Page_Ahead(self):
+        fetchedCursors = []
+        pageFetched = threading.Event()
+
+        def fetch_page(cursor):
+            fetchedCursors.append(cursor)
+            pageFetched.set()
+            return [cursor], cursor + 1 if cursor < 9 else None
+
+        pageIterator = prefetch_pages(fetch_page, 0)
+        self.assertEqual(next(pageIterator), 0)
+        pageFetched.wait(1)
+        # The page after the one being consumed is in flight, nothing further
+        self.assertLessEqual(max(fetchedCursors), 1)
+        self.assertEqual(list(pageIterator), list(range(1, 10)))
+
+    def test_Empty_First_Page(self):
+        self.assertEqual(list(prefetch_pages(lambda cursor: ([], None))), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,9 +8,11 @@ sys.path.append('..')
 from src.repoAdapter import ExternalRepoInterface, RepoAdapter
 
 class MockResponse:
-    def __init__(self, json_data, status_code):
+    def __init__(self, json_data, status_code, headers: dict = None):
         self.json_data = json_data
         self.status_code = status_code
+        self.headers = headers if headers else {}
+        self.content = json.dumps(json_data).encode()
 
     def json(self):
         return self.json_data
@@ -60,7 +62,7 @@ class TestRepoAdapter(unittest.TestCase):
             self.repoAdapters['ADO']['Repo Commits Mock'] = json.loads(jsonFile.read())
 
     def test_Get_Repos(self):
-        with patch('src.workitemAdapter.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             for repoAdapter in self.repoAdapters:
                 mock_get.return_value.status_code = 200
                 mock_get.return_value.json.return_value = self.repoAdapters[repoAdapter]['Repo List Mock']
@@ -71,7 +73,7 @@ class TestRepoAdapter(unittest.TestCase):
                 )
 
     def test_Get_Repo_Commits(self):
-        with patch('src.workitemAdapter.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             for repoAdapter in self.repoAdapters:
                 mock_get.return_value.status_code = 200
                 mock_get.return_value.json.return_value = self.repoAdapters[repoAdapter]['Repo Commits Mock']
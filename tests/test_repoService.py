@@ -0,0 +1,66 @@
+import unittest
+import json
+import sys
+from unittest.mock import patch
+sys.path.append('..')
+import repoAdapter
+
+class MockResponse:
+    def __init__(self, json_data, status_code, headers: dict = None):
+        self.json_data = json_data
+        self.status_code = status_code
+        self.headers = headers if headers else {}
+        self.content = json.dumps(json_data).encode()
+
+    def json(self):
+        return self.json_data
+
+def ado_commit(commitId: str, date: str) -> dict:
+    return {"commitId": commitId, "committer": {"name": "Connor Davenport", "email": "connor@example.com", "date": date}}
+
+class TestRepoService(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.client = repoAdapter.app.test_client()
+        self.requestData = {"username": "user", "pat": "pat", "org": "service-org", "project": "service-project"}
+        self.commits = [ado_commit("c2", "2022-12-02T10:00:00Z"), ado_commit("c1", "2022-12-01T10:00:00Z")]
+        self.upstreamHeaders = []
+        repoAdapter.servicePool.Clear()
+
+    def tearDown(self) -> None:
+        repoAdapter.servicePool.Clear()
+
+    def get_side_effect(self, url, *args, **kwargs):
+        self.upstreamHeaders.append(kwargs['headers'])
+        etag = f'"{self.commits[0]["commitId"]}"'
+        if kwargs['headers'].get('If-None-Match') == etag:
+            return MockResponse(None, 304, {'ETag': etag})
+        if url.endswith("/git/repositories"):
+            return MockResponse({"value": [{"name": "ManagingSoftware"}]}, 200, {'ETag': etag})
+        return MockResponse({"value": self.commits}, 200, {'ETag': etag})
+
+    def test_Repo_Commits_Not_Modified(self):
+        with patch('requests.Session.get', side_effect=self.get_side_effect):
+            response = self.client.get("/repo/commits/ManagingSoftware", json=self.requestData)
+            self.assertEqual([commit[0] for commit in response.get_json()["Values"]], ["c1", "c2"])
+            etag = response.headers['ETag']
+
+            response = self.client.get("/repo/commits/ManagingSoftware", json=self.requestData, headers={'If-None-Match': etag})
+            self.assertEqual(response.status_code, 304)
+            # Listings are always revalidated upstream rather than served from memory
+            self.assertEqual(self.upstreamHeaders[-1]['If-None-Match'], '"c2"')
+
+            self.commits.insert(0, ado_commit("c3", "2022-12-03T10:00:00Z"))
+            response = self.client.get("/repo/commits/ManagingSoftware", json=self.requestData, headers={'If-None-Match': etag})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.get_json()["Values"]), 3)
+
+    def test_Repos_Not_Modified(self):
+        with patch('requests.Session.get', side_effect=self.get_side_effect):
+            response = self.client.get("/repos", json=self.requestData)
+            self.assertEqual(response.get_json()["Values"], ["ManagingSoftware"])
+            response = self.client.get("/repos", json=self.requestData, headers={'If-None-Match': response.headers['ETag']})
+            self.assertEqual(response.status_code, 304)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import sys
+import threading
+from unittest.mock import patch
+sys.path.append('..')
+from responseCache import ResponseCache
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.scope = ResponseCache.Get_Scope(('', 'pat'))
+
+    def test_Hit_And_Miss(self):
+        cache = ResponseCache()
+        self.assertIsNone(cache.Get("https://host/wit/workitems/1", self.scope))
+        cache.Set("https://host/wit/workitems/1", self.scope, {"id": 1}, 10)
+        self.assertEqual(cache.Get("https://host/wit/workitems/1", self.scope), {"id": 1})
+        self.assertIsNone(cache.Get("https://host/wit/workitems/1", ResponseCache.Get_Scope(('', 'other'))))
+
+        stats = cache.Get_Stats()
+        self.assertEqual((stats['Hits'], stats['Misses']), (1, 2))
+
+    def test_TTL_Expiry(self):
+        cache = ResponseCache(ttlSeconds=10)
+        with patch('responseCache.time.monotonic', return_value=100):
+            cache.Set("https://host/a", self.scope, {"a": 1})
+        with patch('responseCache.time.monotonic', return_value=105):
+            self.assertEqual(cache.Get("https://host/a", self.scope), {"a": 1})
+        with patch('responseCache.time.monotonic', return_value=111):
+            self.assertIsNone(cache.Get("https://host/a", self.scope))
+        self.assertEqual(cache.Get_Stats()['Entries'], 0)
+
+    def test_LRU_Eviction(self):
+        cache = ResponseCache(maxEntries=2)
+        cache.Set("https://host/a", self.scope, "a")
+        cache.Set("https://host/b", self.scope, "b")
+        cache.Get("https://host/a", self.scope)
+        cache.Set("https://host/c", self.scope, "c")
+        self.assertEqual(cache.Get("https://host/a", self.scope), "a")
+        self.assertIsNone(cache.Get("https://host/b", self.scope))
+
+        cache = ResponseCache(maxBytes=100)
+        cache.Set("https://host/a", self.scope, "a", 60)
+        cache.Set("https://host/b", self.scope, "b", 60)
+        self.assertIsNone(cache.Get("https://host/a", self.scope))
+        self.assertEqual(cache.Get_Stats()['Bytes'], 60)
+        self.assertEqual(cache.Get_Stats()['Evictions'], 1)
+
+    def test_Invalidate(self):
+        cache = ResponseCache()
+        for url in ["https://host/workitems/1", "https://host/workitems/1/updates", "https://host/workitems/1?$expand=relations", "https://host/workitems/10"]:
+            cache.Set(url, self.scope, url)
+        cache.Invalidate("https://host/workitems/1")
+        self.assertEqual(cache.Get_Stats()['Entries'], 1)
+        self.assertIsNotNone(cache.Get("https://host/workitems/10", self.scope))
+
+        cache.Invalidate()
+        self.assertEqual(cache.Get_Stats()['Entries'], 0)
+
+    def test_Revalidation(self):
+        cache = ResponseCache(ttlSeconds=10)
+        with patch('responseCache.time.monotonic', return_value=100):
+            cache.Set("https://host/a", self.scope, {"a": 1}, 10, '"v1"')
+            cache.Set("https://host/b", self.scope, {"b": 1}, 10)
+        with patch('responseCache.time.monotonic', return_value=111):
+            # Expired entries stay available for revalidation only when they carry an ETag
+            self.assertIsNone(cache.Get("https://host/a", self.scope))
+            self.assertIsNone(cache.Get("https://host/b", self.scope))
+            self.assertEqual(cache.Get_Validator("https://host/a", self.scope), ('"v1"', {"a": 1}))
+            self.assertIsNone(cache.Get_Validator("https://host/b", self.scope))
+
+            cache.Refresh("https://host/a", self.scope)
+            self.assertEqual(cache.Get("https://host/a", self.scope), {"a": 1})
+        self.assertEqual(cache.Get_Stats()['Revalidations'], 1)
+
+    def test_Thread_Safety(self):
+        cache = ResponseCache(maxEntries=50)
+
+        def worker(offset):
+            for i in range(0, 500):
+                cache.Set(f"https://host/{(offset + i) % 80}", self.scope, i, 1)
+                cache.Get(f"https://host/{i % 80}", self.scope)
+
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(0, 8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.Get_Stats()
+        self.assertLessEqual(stats['Entries'], 50)
+        self.assertEqual(stats['Bytes'], stats['Entries'])
+        self.assertEqual(stats['Hits'] + stats['Misses'], 8 * 500)
+
+if __name__ == "__main__":
+    unittest.main()
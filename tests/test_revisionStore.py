@@ -0,0 +1,92 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+from unittest.mock import patch
+sys.path.append('..')
+from workitemAdapter import ExternalWorkitemInterface, WorkitemAdapter
+from workitemScope import workitemScope
+from revisionStore import RevisionStore
+
+class MockResponse:
+    def __init__(self, json_data, status_code, headers: dict = None):
+        self.json_data = json_data
+        self.status_code = status_code
+        self.headers = headers if headers else {}
+        self.content = json.dumps(json_data).encode()
+
+    def json(self):
+        return self.json_data
+
+def ado_update(state: str, changedDate: str) -> dict:
+    return {"fields": {"System.State": {"newValue": state}, "System.ChangedDate": {"newValue": changedDate}}}
+
+class TestRevisionStore(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tempDirectory = tempfile.TemporaryDirectory()
+        self.revisionStore = RevisionStore(os.path.join(self.tempDirectory.name, "revisions.db"))
+        self.remoteUpdates = [ado_update("New", "2022-12-01T10:00:00Z"), ado_update("Active", "2022-12-02T10:00:00Z")]
+        self.requestedURLs = []
+        self.postedQueries = []
+        with patch('requests.Session.get') as mock_get:
+            mock_get.return_value = MockResponse({"value": [{"referenceName": "System.State"}]}, 200)
+            self.workitemAdapter = WorkitemAdapter(ExternalWorkitemInterface.ADO, None, "pat", "org", "project", revisionStore=self.revisionStore)
+
+    def tearDown(self) -> None:
+        self.revisionStore.Close()
+        self.tempDirectory.cleanup()
+
+    def request_side_effect(self, *args, **kwargs):
+        url = args[0]
+        self.requestedURLs.append(url)
+        skip = int(url.split('$skip=')[1].split('&')[0])
+        return MockResponse({"value": self.remoteUpdates[skip:]}, 200)
+
+    def post_side_effect(self, *args, **kwargs):
+        self.postedQueries.append(kwargs['json']['query'])
+        return MockResponse({"workItems": [{"id": 1}]}, 200)
+
+    def test_Store_Round_Trip(self):
+        self.revisionStore.Append_Revisions("scope", "1", [{"rev": 1}, {"rev": 2}])
+        self.revisionStore.Append_Revisions("scope", "1", [{"rev": 3}])
+        self.assertEqual(self.revisionStore.Get_Revisions("scope", "1"), [{"rev": 1}, {"rev": 2}, {"rev": 3}])
+        self.assertEqual(self.revisionStore.Get_Revision_Count("scope", "1"), 3)
+        self.assertIsNone(self.revisionStore.Get_Revisions("scope", "2"))
+
+        highWater = datetime(year=2022, month=12, day=1, hour=8)
+        self.revisionStore.Set_High_Water("scope", highWater)
+        self.assertEqual(self.revisionStore.Get_High_Water("scope"), highWater)
+
+    def test_Incremental_Sync(self):
+        with patch('requests.Session.get', side_effect=self.request_side_effect):
+            with patch('requests.Session.post', side_effect=self.post_side_effect):
+                self.assertEqual(len(self.workitemAdapter.Get_Workitem_History('1')), 2)
+                self.workitemAdapter.Sync_Revision_Store()
+                self.assertNotIn("ChangedDate", self.postedQueries[-1])
+                self.assertIn("$skip=2", self.requestedURLs[-1])
+
+                self.remoteUpdates.append(ado_update("Closed", "2022-12-03T10:00:00Z"))
+                self.workitemAdapter.Sync_Revision_Store()
+                self.assertIn("[System.ChangedDate] >", self.postedQueries[-1])
+                self.assertIn("$skip=2", self.requestedURLs[-1])
+
+                requestCount = len(self.requestedURLs)
+                history = self.workitemAdapter.Get_Workitem_History('1')
+                self.assertEqual(len(self.requestedURLs), requestCount)
+                self.assertEqual([update['fields']['System.State']['newValue'] for update in history], ["New", "Active", "Closed"])
+
+    def test_Scope_Query_String(self):
+        scope = workitemScope(ExternalWorkitemInterface.ADO, workitemTypeList=["Bug"], lastUpdated=datetime(year=2022, month=12, day=1))
+        self.assertEqual(
+            scope.Get_Query_String(),
+            "SELECT [System.Id] FROM workitems WHERE [System.WorkItemType] IN ('Bug') AND [System.ChangedDate] > '2022-12-01T00:00:00Z'"
+        )
+        scope = workitemScope(ExternalWorkitemInterface.JIRA, project="SAN", lastUpdated=datetime(year=2022, month=12, day=1, hour=9, minute=30))
+        self.assertEqual(scope.Get_Query_String(), 'project = "SAN" AND updated >= "2022/12/01 09:30"')
+        self.assertEqual(workitemScope(ExternalWorkitemInterface.ADO).Get_Query_String(), "SELECT [System.Id] FROM workitems")
+
+if __name__ == "__main__":
+    unittest.main()
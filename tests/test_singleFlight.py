@@ -0,0 +1,123 @@
+import unittest
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from unittest.mock import patch
+sys.path.append('..')
+from singleFlight import SingleFlight
+from workitemAdapter import ExternalWorkitemInterface, WorkitemAdapter
+
+class MockResponse:
+    def __init__(self, json_data, status_code, headers: dict = None):
+        self.json_data = json_data
+        self.status_code = status_code
+        self.headers = headers if headers else {}
+        self.content = json.dumps(json_data).encode()
+
+    def json(self):
+        return self.json_data
+
+class TestSingleFlight(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.singleFlight = SingleFlight(timeout=5)
+        self.callCount = 0
+        self.release = threading.Event()
+
+    def slow_call(self):
+        self.callCount += 1
+        self.release.wait(5)
+        return {"value": self.callCount}
+
+    def start_callers(self, count: int, key: str = "key", timeout: float = None):
+        executor = ThreadPoolExecutor(max_workers=count)
+        leader = executor.submit(self.singleFlight.Do, key, self.slow_call)
+        while self.singleFlight.Get_Stats()["In Flight"] == 0:
+            time.sleep(0.001)
+        followers = [executor.submit(self.singleFlight.Do, key, self.slow_call, timeout) for _ in range(count - 1)]
+        time.sleep(0.05)
+        return executor, leader, followers
+
+    def test_Concurrent_Callers_Share_Result(self):
+        executor, leader, followers = self.start_callers(8)
+        self.release.set()
+        results = [leader.result()] + [follower.result() for follower in followers]
+        executor.shutdown()
+
+        self.assertEqual(self.callCount, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        stats = self.singleFlight.Get_Stats()
+        self.assertEqual((stats["In Flight"], stats["Leaders"], stats["Shared"]), (0, 1, 7))
+
+    def test_Sequential_Callers_Not_Coalesced(self):
+        self.release.set()
+        self.singleFlight.Do("key", self.slow_call)
+        self.singleFlight.Do("key", self.slow_call)
+        self.assertEqual(self.callCount, 2)
+
+    def test_Exception_Shared(self):
+        def failing_call():
+            self.release.wait(5)
+            raise ValueError("Upstream failed")
+
+        executor = ThreadPoolExecutor(max_workers=2)
+        leader = executor.submit(self.singleFlight.Do, "key", failing_call)
+        while self.singleFlight.Get_Stats()["In Flight"] == 0:
+            time.sleep(0.001)
+        follower = executor.submit(self.singleFlight.Do, "key", failing_call)
+        time.sleep(0.05)
+        self.release.set()
+        with self.assertRaises(ValueError):
+            leader.result()
+        with self.assertRaises(ValueError):
+            follower.result()
+        executor.shutdown()
+
+    def test_Follower_Timeout(self):
+        executor, leader, followers = self.start_callers(2, timeout=0.01)
+        with self.assertRaises(FutureTimeoutError):
+            followers[0].result()
+        self.release.set()
+        self.assertEqual(leader.result(), {"value": 1})
+        executor.shutdown()
+        self.assertEqual(self.singleFlight.Get_Stats()["Timeouts"], 1)
+
+    def test_Cancel(self):
+        executor, leader, followers = self.start_callers(3)
+        self.assertTrue(self.singleFlight.Cancel("key"))
+        for follower in followers:
+            with self.assertRaises(CancelledError):
+                follower.result()
+        self.release.set()
+        # The leader still gets its own result
+        self.assertEqual(leader.result(), {"value": 1})
+        executor.shutdown()
+        self.assertFalse(self.singleFlight.Cancel("key"))
+
+    def test_Adapter_Coalesces_Upstream_Calls(self):
+        requestedURLs = []
+
+        def get_side_effect(url, *args, **kwargs):
+            if url.endswith("/wit/fields"):
+                return MockResponse({"value": [{"referenceName": "System.State", "name": "State"}]}, 200)
+            requestedURLs.append(url)
+            self.release.wait(5)
+            return MockResponse({"value": [{"rev": 1}]}, 200)
+
+        with patch('requests.Session.get', side_effect=get_side_effect):
+            workitemAdapter = WorkitemAdapter(ExternalWorkitemInterface.ADO, None, "pat", "single-flight-org", "project")
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                histories = [executor.submit(workitemAdapter.Get_Workitem_History, "1") for _ in range(6)]
+                time.sleep(0.1)
+                self.release.set()
+                histories = [history.result() for history in histories]
+
+        self.assertEqual(len(requestedURLs), 1)
+        self.assertTrue(all(history == [{"rev": 1}] for history in histories))
+        self.assertEqual(workitemAdapter.Get_Single_Flight_Stats()["Shared"], 5)
+
+if __name__ == "__main__":
+    unittest.main()
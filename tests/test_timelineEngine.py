@@ -0,0 +1,79 @@
+import unittest
+import sys
+from datetime import datetime, timedelta
+sys.path.append('..')
+from timelineEngine import timeline_steps, build_timeline, build_timelines
+
+class TestTimelineEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.fromDate = datetime(2023, 1, 1, 9)
+        self.toDate = datetime(2023, 1, 5, 17)
+
+    def test_Timeline_Steps(self):
+        steps = timeline_steps(self.fromDate, self.toDate)
+        # Four whole days plus the partial day up to toDate
+        self.assertEqual(len(steps), 6)
+        self.assertEqual(steps[0].astype(datetime), self.fromDate)
+        self.assertEqual(steps[-1].astype(datetime), self.fromDate + timedelta(days=5))
+        self.assertEqual(len(timeline_steps(self.fromDate, self.fromDate + timedelta(days=4))), 5)
+
+    def test_No_Changes(self):
+        _, values = build_timeline([], self.fromDate, self.toDate, "Active")
+        self.assertEqual(list(values), ["Active"] * 6)
+
+    def test_Changes_In_Range(self):
+        fieldChanges = [
+            {'From': "Active", 'To': "Resolved", 'Date': datetime(2023, 1, 4, 11)},
+            {'From': "New", 'To': "Active", 'Date': datetime(2023, 1, 2, 15)}
+        ]
+        steps, values = build_timeline(fieldChanges, self.fromDate, self.toDate)
+        self.assertEqual(len(steps), len(values))
+        self.assertEqual(list(values), ["New", "Active", "Active", "Resolved", "Resolved", "Resolved"])
+
+    def test_Same_Day_Changes(self):
+        fieldChanges = [
+            {'From': "New", 'To': "Active", 'Date': datetime(2023, 1, 3, 8)},
+            {'From': "Active", 'To': "Resolved", 'Date': datetime(2023, 1, 3, 12)},
+            {'From': "Resolved", 'To': "Closed", 'Date': datetime(2023, 1, 3, 18)}
+        ]
+        _, values = build_timeline(fieldChanges, self.fromDate, self.toDate)
+        self.assertEqual(list(values), ["New", "New", "Closed", "Closed", "Closed", "Closed"])
+
+    def test_Changes_Before_Range(self):
+        fieldChanges = [
+            {'From': None, 'To': "New", 'Date': datetime(2022, 12, 1)},
+            {'From': "New", 'To': "Active", 'Date': datetime(2022, 12, 15)}
+        ]
+        _, values = build_timeline(fieldChanges, self.fromDate, self.toDate)
+        self.assertEqual(list(values), ["Active"] * 6)
+
+    def test_Unset_Initial_Value(self):
+        fieldChanges = [{'From': None, 'To': "Sprint 2", 'Date': datetime(2023, 1, 3, 10)}]
+        _, values = build_timeline(fieldChanges, self.fromDate, self.toDate)
+        self.assertEqual(list(values), ["Sprint 2"] * 6)
+
+    def test_List_Values(self):
+        _, values = build_timeline([], self.fromDate, self.toDate, ["Sprint 1", "Sprint 2"])
+        self.assertEqual(values[0], ["Sprint 1", "Sprint 2"])
+        self.assertEqual(len(values), 6)
+
+    def test_Hourly_Step(self):
+        fieldChanges = [{'From': "New", 'To': "Active", 'Date': datetime(2023, 1, 1, 11, 30)}]
+        _, values = build_timeline(fieldChanges, self.fromDate, datetime(2023, 1, 1, 13), step=timedelta(hours=1))
+        self.assertEqual(list(values), ["New", "New", "Active", "Active", "Active"])
+
+    def test_Multiple_Workitems(self):
+        fieldChangesList = [
+            [{'From': "New", 'To': "Active", 'Date': datetime(2023, 1, 2, 10)}],
+            [],
+            [{'From': "Active", 'To': "Closed", 'Date': datetime(2023, 1, 5, 10)}]
+        ]
+        steps, values = build_timelines(fieldChangesList, self.fromDate, self.toDate, ["Active", "Closed", "Active"])
+        self.assertEqual(values.shape, (3, len(steps)))
+        self.assertEqual(list(values[0]), ["New", "Active", "Active", "Active", "Active", "Active"])
+        self.assertEqual(list(values[1]), ["Closed"] * 6)
+        self.assertEqual(list(values[2]), ["Active", "Active", "Active", "Active", "Closed", "Closed"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,9 +8,11 @@ sys.path.append('..')
 from src.workitemAdapter import ExternalWorkitemInterface, WorkitemAdapter
 
 class MockResponse:
-    def __init__(self, json_data, status_code):
+    def __init__(self, json_data, status_code, headers: dict = None):
         self.json_data = json_data
         self.status_code = status_code
+        self.headers = headers if headers else {}
+        self.content = json.dumps(json_data).encode()
 
     def json(self):
         return self.json_data
@@ -128,7 +130,7 @@ class TestWorkitemAdapter(unittest.TestCase):
                 result = self.workitemAdapters[workitemAdapter]['Adapter'].Str_To_Datetime("*1-mm-2022")
 
     def test_Get_Workitem_Response(self):
-        with patch('src.workitemAdapter.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             for workitemAdapter in self.workitemAdapters:
                 mock_get.return_value.status_code = 200
                 mock_get.return_value.json.return_value = self.workitemAdapters[workitemAdapter]['Workitem Mock']
@@ -136,7 +138,7 @@ class TestWorkitemAdapter(unittest.TestCase):
                 self.assertTrue('fields' in response)
 
     def test_Get_Workitem_Fields(self):
-        with patch('src.workitemAdapter.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             for workitemAdapter in self.workitemAdapters:
                 mock_get.return_value.status_code = 200
                 mock_get.return_value.json.return_value = self.workitemAdapters[workitemAdapter]['Workitem Mock']
@@ -147,7 +149,7 @@ class TestWorkitemAdapter(unittest.TestCase):
         for workitemAdapter in self.workitemAdapters:
             self.currentMockData = self.workitemAdapters[workitemAdapter]['Workitem Mock']
             self.currentRelationMockData = self.workitemAdapters[workitemAdapter]['Workitem Relation Mock']
-            with patch('src.workitemAdapter.requests.get', side_effect=self.request_side_effect) as mock_get:
+            with patch('requests.Session.get', side_effect=self.request_side_effect) as mock_get:
                 response = self.workitemAdapters[workitemAdapter]['Adapter'].Get_Workitem_Associations('1')
                 self.assertTrue('Parent' in response) # TODO: Allow this to test for other relationships as well, but would need to pass more data for relationMockData specifically for Jira to do this
             
@@ -186,7 +188,7 @@ class TestWorkitemAdapter(unittest.TestCase):
             )
 
     def test_Get_Workitem_Title(self):
-        with patch('src.workitemAdapter.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             for workitemAdapter in self.workitemAdapters:
                 mock_get.return_value.status_code = 200
                 mock_get.return_value.json.return_value = self.workitemAdapters[workitemAdapter]['Workitem Mock']
@@ -197,7 +199,7 @@ class TestWorkitemAdapter(unittest.TestCase):
                 )
 
     def test_Get_Workitem_State(self):
-        with patch('src.workitemAdapter.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             for workitemAdapter in self.workitemAdapters:
                 mock_get.return_value.status_code = 200
                 mock_get.return_value.json.return_value = self.workitemAdapters[workitemAdapter]['Workitem Mock']
@@ -207,8 +209,25 @@ class TestWorkitemAdapter(unittest.TestCase):
                     response == "Done"
                 )
 
+    def test_Workitem_Response_Cache(self):
+        with patch('requests.Session.get') as mock_get:
+            for workitemAdapter in self.workitemAdapters:
+                mock_get.reset_mock()
+                mock_get.return_value.status_code = 200
+                mock_get.return_value.json.return_value = self.workitemAdapters[workitemAdapter]['Workitem Mock']
+                adapter = self.workitemAdapters[workitemAdapter]['Adapter']
+                adapter.Get_Workitem_Title('1')
+                adapter.Get_Workitem_State('1')
+                adapter.Get_Workitem_Assignee('1')
+                self.assertEqual(mock_get.call_count, 1)
+
+                adapter.Invalidate_Cache('1')
+                adapter.Get_Workitem_Title('1')
+                self.assertEqual(mock_get.call_count, 2)
+                self.assertGreaterEqual(adapter.Get_Cache_Stats()['Hits'], 2)
+
     def test_Get_Workitem_Description(self):
-        with patch('src.workitemAdapter.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             for workitemAdapter in self.workitemAdapters:
                 mock_get.return_value.status_code = 200
                 mock_get.return_value.json.return_value = self.workitemAdapters[workitemAdapter]['Workitem Mock']
@@ -219,7 +238,7 @@ class TestWorkitemAdapter(unittest.TestCase):
                 )
 
     def test_Get_Workitem_Assignee(self):
-        with patch('src.workitemAdapter.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             for workitemAdapter in self.workitemAdapters:
                 mock_get.return_value.status_code = 200
                 mock_get.return_value.json.return_value = self.workitemAdapters[workitemAdapter]['Workitem Mock']
@@ -227,7 +246,7 @@ class TestWorkitemAdapter(unittest.TestCase):
                 self.assertTrue(response == "Connor Davenport")
                 
     def test_Get_Workitem_Created_Date(self):
-        with patch('src.workitemAdapter.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             for workitemAdapter in self.workitemAdapters:
                 mock_get.return_value.status_code = 200
                 mock_get.return_value.json.return_value = self.workitemAdapters[workitemAdapter]['Workitem Mock']
@@ -242,7 +261,7 @@ class TestWorkitemAdapter(unittest.TestCase):
             self.currentMockData = self.workitemAdapters[workitemAdapter]['Workitem Mock']
             self.currentRelationMockData = self.workitemAdapters[workitemAdapter]['Workitem Relation Mock']
             self.currentHistoryMockData = self.workitemAdapters[workitemAdapter]['Workitem History Mock']
-            with patch('src.workitemAdapter.requests.get', side_effect=self.request_side_effect) as mock_get:
+            with patch('requests.Session.get', side_effect=self.request_side_effect) as mock_get:
                 with patch.object(WorkitemAdapter, "fieldList", new_callable=PropertyMock) as objectPatch:
                     objectPatch.return_value = ["System.State"]
                     response = self.workitemAdapters[workitemAdapter]['Adapter'].Get_Workitem_Field_History('1', "System.State")
@@ -253,10 +272,93 @@ class TestWorkitemAdapter(unittest.TestCase):
                         isinstance(response[0][0], datetime)
                     )
 
+    def test_Get_Workitems(self):
+        for workitemAdapter in self.workitemAdapters:
+            workitemMock = self.workitemAdapters[workitemAdapter]['Workitem Mock']
+            workitemIDs = [str(workitemID) for workitemID in range(1, 451)] if workitemAdapter == "ADO" else [f"SAN-{workitemID}" for workitemID in range(1, 151)]
+            batchPayloads = []
+
+            def batch_side_effect(*args, **kwargs):
+                batchPayloads.append(kwargs['json'])
+                return MockResponse({"value": [{"id": workitemID, "fields": workitemMock['fields']} for workitemID in kwargs['json']['ids']]}, 200)
+
+            def search_side_effect(*args, **kwargs):
+                keys = args[0].split('key%20in%20%28')[1].split('%29')[0].split('%2C')
+                return MockResponse({"startAt": 0, "total": len(keys), "issues": [{"key": key, "fields": workitemMock['fields']} for key in keys]}, 200)
+
+            with patch('requests.Session.post', side_effect=batch_side_effect) as mock_post:
+                with patch('requests.Session.get', side_effect=search_side_effect) as mock_get:
+                    response = self.workitemAdapters[workitemAdapter]['Adapter'].Get_Workitem_Titles(workitemIDs)
+                    self.assertEqual(list(response.keys()), workitemIDs)
+                    self.assertTrue(
+                        response[workitemIDs[0]] == "MVP: Static Config and External Adapters" or
+                        response[workitemIDs[0]] == "ADO Integration"
+                    )
+                    if workitemAdapter == "ADO":
+                        self.assertEqual([len(batchPayload['ids']) for batchPayload in batchPayloads], [200, 200, 50])
+                        self.assertEqual(batchPayloads[0]['fields'], ['System.Title'])
+                    else:
+                        self.assertEqual(mock_get.call_count, 2)
+                        self.assertIn('fields=summary', mock_get.call_args[0][0])
+
+    def test_Iterate_Jql_Search(self):
+        if 'JIRA' not in self.workitemAdapters:
+            return
+
+        def search_side_effect(*args, **kwargs):
+            startAt = int(args[0].split('startAt=')[1].split('&')[0])
+            return MockResponse({"startAt": startAt, "total": 250, "issues": [{"key": f"SAN-{key}"} for key in range(startAt, min(startAt + 100, 250))]}, 200)
+
+        with patch('requests.Session.get', side_effect=search_side_effect) as mock_get:
+            response = list(self.workitemAdapters['JIRA']['Adapter'].Iterate_Jql_Search("issuetype=Feature"))
+            self.assertEqual(len(response), 250)
+            self.assertEqual(response[-1]['key'], "SAN-249")
+            self.assertEqual(mock_get.call_count, 3)
+
+    def test_Iterate_Wiql_Query(self):
+        if 'ADO' not in self.workitemAdapters:
+            return
+        adapter = self.workitemAdapters['ADO']['Adapter']
+
+        def wiql_side_effect(*args, **kwargs):
+            lastWorkitemID = int(kwargs['json']['query'].split('[System.Id] > ')[1].split(' ')[0])
+            return MockResponse({"workItems": [{"id": workitemID} for workitemID in range(lastWorkitemID + 1, min(lastWorkitemID + 1 + adapter.adoWiqlPageSize, 2501))]}, 200)
+
+        with patch('requests.Session.post', side_effect=wiql_side_effect) as mock_post:
+            response = list(adapter.Iterate_Wiql_Query("[System.WorkItemType] = 'Feature'"))
+            self.assertEqual(response, [str(workitemID) for workitemID in range(1, 2501)])
+            self.assertEqual(mock_post.call_count, 3)
+            self.assertIn("ORDER BY [System.Id]", mock_post.call_args[1]['json']['query'])
+
+    def test_Get_Employee_Contributions(self):
+        for workitemAdapter in self.workitemAdapters:
+            self.currentHistoryMockData = self.workitemAdapters[workitemAdapter]['Workitem History Mock']
+            candidateIDs = ['11', '12']
+
+            def search_side_effect(*args, **kwargs):
+                if 'updatedBy' in args[0]:
+                    return MockResponse({"startAt": 0, "total": 2, "issues": [{"id": candidateID, "key": f"SAN-{candidateID}"} for candidateID in candidateIDs]}, 200)
+                return self.request_side_effect(*args, **kwargs)
+
+            with patch('requests.Session.get', side_effect=search_side_effect) as mock_get:
+                with patch('requests.Session.post') as mock_post:
+                    mock_post.return_value = MockResponse({"workItems": [{"id": int(candidateID)} for candidateID in candidateIDs]}, 200)
+                    response = self.workitemAdapters[workitemAdapter]['Adapter'].Get_Employee_Contributions(
+                        "Connor Davenport", fromDate=datetime(year=2022, month=11, day=1), toDate=datetime(year=2022, month=12, day=31))
+
+                    if workitemAdapter == "ADO":
+                        self.assertIn("[System.ChangedBy] EVER 'Connor Davenport'", mock_post.call_args[1]['json']['query'])
+                    else:
+                        self.assertIn("updatedBy", mock_get.call_args_list[0][0][0])
+                    historyURLs = [call[0][0] for call in mock_get.call_args_list if '/updates' in call[0][0] or 'expand=changelog' in call[0][0]]
+                    self.assertEqual(len(historyURLs), len(candidateIDs))
+                    self.assertEqual({workitemID for workitemID, _ in response}, set(candidateIDs))
+                    self.assertTrue(all(isinstance(changeDate, datetime) for _, changeDate in response))
+
     def test_Get_Projects(self):
         for workitemAdapter in self.workitemAdapters:
             self.currentProjectMockData = self.workitemAdapters[workitemAdapter]['Project Mock']
-            with patch('src.workitemAdapter.requests.get', side_effect=self.request_side_effect) as mock_get:
+            with patch('requests.Session.get', side_effect=self.request_side_effect) as mock_get:
                 response = self.workitemAdapters[workitemAdapter]['Adapter'].Get_Projects()
                 self.assertTrue(
                     isinstance(response, list) and
@@ -267,8 +369,8 @@ class TestWorkitemAdapter(unittest.TestCase):
     def test_Get_Features(self):
         for workitemAdapter in self.workitemAdapters:
             self.currentFeatureMockData = self.workitemAdapters[workitemAdapter]['Feature Mock']
-            with patch('src.workitemAdapter.requests.get', side_effect=self.request_side_effect) as mock_get:
-                with patch('src.workitemAdapter.requests.post') as mock_post:
+            with patch('requests.Session.get', side_effect=self.request_side_effect) as mock_get:
+                with patch('requests.Session.post') as mock_post:
                     mock_post.return_value.status_code = 200
                     mock_post.return_value.json.return_value = self.workitemAdapters[workitemAdapter]['Feature Mock']
                     response = self.workitemAdapters[workitemAdapter]['Adapter'].Get_Features()
@@ -278,7 +380,7 @@ class TestWorkitemAdapter(unittest.TestCase):
                     )
 
     def test_Get_Workitem_Sprint(self):
-        with patch('src.workitemAdapter.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             for workitemAdapter in self.workitemAdapters:
                 mock_get.return_value.status_code = 200
                 mock_get.return_value.json.return_value = self.workitemAdapters[workitemAdapter]['Workitem Mock']
@@ -289,7 +391,7 @@ class TestWorkitemAdapter(unittest.TestCase):
                 )
 
     def test_Get_Sprints(self):
-        with patch('src.workitemAdapter.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             for workitemAdapter in self.workitemAdapters:
                 mock_get.return_value.status_code = 200
                 mock_get.return_value.json.return_value = self.workitemAdapters[workitemAdapter]['Sprints Mock']
@@ -300,7 +402,7 @@ class TestWorkitemAdapter(unittest.TestCase):
                 )
 
     def test_Get_Board_or_Teams(self):
-        with patch('src.workitemAdapter.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             for workitemAdapter in self.workitemAdapters:
                 mock_get.return_value.status_code = 200
                 mock_get.return_value.json.return_value = self.workitemAdapters[workitemAdapter]['Group Mock']
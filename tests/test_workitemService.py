@@ -0,0 +1,137 @@
+import unittest
+import json
+import sys
+from unittest.mock import patch
+sys.path.append('..')
+import workitemAdapter
+
+class MockResponse:
+    def __init__(self, json_data, status_code, headers: dict = None):
+        self.json_data = json_data
+        self.status_code = status_code
+        self.headers = headers if headers else {}
+        self.content = json.dumps(json_data).encode()
+
+    def json(self):
+        return self.json_data
+
+def ado_update(state: str, changedDate: str) -> dict:
+    return {"fields": {"System.State": {"oldValue": "New", "newValue": state}, "System.ChangedDate": {"newValue": changedDate}}}
+
+class TestWorkitemService(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.client = workitemAdapter.app.test_client()
+        self.requestData = {"username": "user", "pat": "pat", "org": "service-org", "project": "service-project"}
+        self.postedBatches = []
+        workitemAdapter.servicePool.Clear()
+        workitemAdapter.serviceCache.Invalidate()
+
+    def tearDown(self) -> None:
+        workitemAdapter.servicePool.Clear()
+        workitemAdapter.serviceCache.Invalidate()
+
+    def get_side_effect(self, url, *args, **kwargs):
+        if url.endswith("/wit/fields"):
+            return MockResponse({"value": [{"referenceName": "System.State", "name": "State"}]}, 200)
+        if url.endswith("/updates"):
+            return MockResponse({"value": [ado_update("Active", "2022-12-02T10:00:00Z")]}, 200)
+        return MockResponse({"id": 1, "rev": 2, "fields": {"System.State": "Active", "System.CreatedDate": "2022-12-01T09:00:00Z"}}, 200)
+
+    def post_side_effect(self, url, *args, **kwargs):
+        self.postedBatches.append(kwargs['json'])
+        # Work item 7 does not exist, so the batch API omits it
+        return MockResponse({"value": [{"id": workitemID, "fields": {"System.State": "Active"}} for workitemID in kwargs['json']['ids'] if workitemID != 7]}, 200)
+
+    def read_lines(self, response) -> list:
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    def test_Workitems_Batch(self):
+        with patch('requests.Session.get', side_effect=self.get_side_effect), patch('requests.Session.post', side_effect=self.post_side_effect):
+            response = self.client.post("/workitems:batch", json={**self.requestData, "ids": list(range(1, 451)), "fields": ["System.State"]})
+            lines = self.read_lines(response)
+
+        self.assertEqual(len(self.postedBatches), 3)
+        self.assertTrue(all(batch['fields'] == ["System.State"] for batch in self.postedBatches))
+        self.assertEqual(sorted(int(line["ID"]) for line in lines), list(range(1, 451)))
+        missingLines = [line for line in lines if line["Status"] == 404]
+        self.assertEqual([line["ID"] for line in missingLines], ["7"])
+        self.assertTrue(all(line["Fields"] == {"System.State": "Active"} for line in lines if line["Status"] == 200))
+
+    def test_Workitems_History_Batch(self):
+        with patch('requests.Session.get', side_effect=self.get_side_effect):
+            response = self.client.post("/workitems/history:batch", json={
+                **self.requestData, "ids": ["1", "2", "3"], "field": "System.State",
+                "fromDate": "2022-12-01T00:00:00", "toDate": "2022-12-04T00:00:00"
+            })
+            lines = self.read_lines(response)
+
+        self.assertEqual(sorted(line["ID"] for line in lines), ["1", "2", "3"])
+        for line in lines:
+            self.assertEqual(line["Status"], 200)
+            self.assertEqual(line["Dates"][0], "2022-12-01T00:00:00")
+            self.assertEqual(line["Values"], ["New", "Active", "Active", "Active"])
+
+    def test_Workitems_History_Batch_Unknown_Field(self):
+        with patch('requests.Session.get', side_effect=self.get_side_effect):
+            response = self.client.post("/workitems/history:batch", json={**self.requestData, "ids": ["1"], "field": "System.Missing"})
+            lines = self.read_lines(response)
+
+        self.assertEqual(lines[0]["Status"], 500)
+        self.assertIn("System.Missing", lines[0]["Message"])
+
+    def test_Workitem_Not_Modified(self):
+        with patch('requests.Session.get', side_effect=self.get_side_effect) as mock_get:
+            response = self.client.get("/workitem/1", json=self.requestData)
+            self.assertEqual(response.status_code, 200)
+            etag = response.headers['ETag']
+
+            response = self.client.get("/workitem/1", json=self.requestData, headers={'If-None-Match': etag})
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.get_data(), b"")
+
+            historyResponse = self.client.get("/workitem/history/1", json=self.requestData)
+            updatesRequests = len([call for call in mock_get.call_args_list if call.args[0].endswith("/updates")])
+            historyResponse = self.client.get("/workitem/history/1", json=self.requestData, headers={'If-None-Match': historyResponse.headers['ETag']})
+            self.assertEqual(historyResponse.status_code, 304)
+            self.assertEqual(len([call for call in mock_get.call_args_list if call.args[0].endswith("/updates")]), updatesRequests)
+
+    def test_Workitem_Modified(self):
+        revisions = iter([1, 2])
+
+        def revision_side_effect(url, *args, **kwargs):
+            if url.endswith("/wit/fields"):
+                return self.get_side_effect(url)
+            return MockResponse({"id": 1, "rev": next(revisions), "fields": {}}, 200)
+
+        with patch('requests.Session.get', side_effect=revision_side_effect):
+            etag = self.client.get("/workitem/1", json=self.requestData).headers['ETag']
+            workitemAdapter.serviceCache.Invalidate()
+            response = self.client.get("/workitem/1", json=self.requestData, headers={'If-None-Match': etag})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json()["Value"]["rev"], 2)
+            self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_Upstream_Revalidation(self):
+        upstreamHeaders = []
+
+        def etag_side_effect(url, *args, **kwargs):
+            if url.endswith("/wit/fields"):
+                return self.get_side_effect(url)
+            upstreamHeaders.append(kwargs['headers'])
+            if kwargs['headers'].get('If-None-Match') == '"rev-1"':
+                return MockResponse(None, 304, {'ETag': '"rev-1"'})
+            return MockResponse({"id": 1, "rev": 1, "fields": {}}, 200, {'ETag': '"rev-1"'})
+
+        with patch('requests.Session.get', side_effect=etag_side_effect):
+            self.client.get("/workitem/1", json=self.requestData)
+            with patch('responseCache.time.monotonic', return_value=10 ** 9):
+                response = self.client.get("/workitem/1", json=self.requestData)
+
+        self.assertEqual(response.get_json()["Value"]["rev"], 1)
+        self.assertEqual(upstreamHeaders[-1]['If-None-Match'], '"rev-1"')
+        self.assertEqual(workitemAdapter.serviceCache.Get_Stats()['Revalidations'], 1)
+
+if __name__ == "__main__":
+    unittest.main()